@@ -13,5 +13,6 @@ for _ in range(100):
     if data is not None:
         recorder.add_frame(data)
 
-# Close recorder (saves data if buffering in memory)
+# Stop the IMU and close recorder (saves data if buffering in memory)
+imu.close()
 recorder.close()
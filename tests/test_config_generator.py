@@ -134,4 +134,9 @@ def test_profile_config_format():
     assert float(profile_parts[2]) == 60.0   # start_freq_ghz
     assert float(profile_parts[3]) == 7.0    # idle_time_us
     assert float(profile_parts[4]) == 3.0    # adc_start_time_us
-    assert float(profile_parts[5]) == 24.0   # ramp_end_time_us 
\ No newline at end of file
+    assert float(profile_parts[5]) == 24.0   # ramp_end_time_us 
+def test_radial_velocity_resolution_coercion():
+    """Test that unsupported radial velocity resolutions fall back to a selectable value."""
+    assert create_default_radar_config().radial_velocity_resolution_ms == 0.13
+    assert create_default_radar_config(radial_velocity_resolution_ms=0.07).radial_velocity_resolution_ms == 0.07
+    assert create_default_radar_config(radial_velocity_resolution_ms=0.5).radial_velocity_resolution_ms == 0.07
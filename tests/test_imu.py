@@ -33,15 +33,15 @@ class TestIMU(unittest.TestCase):
         result = imu.decode_data(self.test_message)
         
         # Check all values match expected
-        self.assertEqual(result['index'], self.expected_values['index'])
-        self.assertAlmostEqual(result['yaw'], self.expected_values['yaw'], places=2)
-        self.assertAlmostEqual(result['pitch'], self.expected_values['pitch'], places=2)
-        self.assertAlmostEqual(result['roll'], self.expected_values['roll'], places=2)
-        self.assertEqual(result['x_acceleration'], self.expected_values['x_acceleration'])
-        self.assertEqual(result['y_acceleration'], self.expected_values['y_acceleration'])
-        self.assertEqual(result['z_acceleration'], self.expected_values['z_acceleration'])
-        self.assertEqual(result['motion_intent'], self.expected_values['motion_intent'])
-        self.assertEqual(result['motion_request'], self.expected_values['motion_request'])
+        self.assertEqual(result.index, self.expected_values['index'])
+        self.assertAlmostEqual(result.yaw, self.expected_values['yaw'], places=2)
+        self.assertAlmostEqual(result.pitch, self.expected_values['pitch'], places=2)
+        self.assertAlmostEqual(result.roll, self.expected_values['roll'], places=2)
+        self.assertEqual(result.x_acceleration, self.expected_values['x_acceleration'])
+        self.assertEqual(result.y_acceleration, self.expected_values['y_acceleration'])
+        self.assertEqual(result.z_acceleration, self.expected_values['z_acceleration'])
+        self.assertEqual(result.motion_intent, self.expected_values['motion_intent'])
+        self.assertEqual(result.motion_request, self.expected_values['motion_request'])
 
     def test_invalid_header(self):
         """Test handling of invalid header."""
@@ -63,6 +63,15 @@ class TestIMU(unittest.TestCase):
         result = imu.decode_data(invalid_checksum)
         self.assertIsNone(result)
 
+    def test_skip_checksum(self):
+        """Test that checksum verification can be disabled."""
+        invalid_checksum = bytes.fromhex('AAAA DE 0100 92FF 2508 8DFE ECFF D103 000000 F7')
+        imu = IMU('/dev/ttyUSB0', mock_mode=True, verify_checksum=False)
+        
+        # Should decode despite the bad checksum
+        result = imu.decode_data(invalid_checksum)
+        self.assertEqual(result.index, self.expected_values['index'])
+
     def test_incomplete_message(self):
         """Test handling of incomplete message."""
         # Create incomplete message
@@ -84,9 +93,9 @@ class TestIMU(unittest.TestCase):
         reading = next(imu)
         
         # Verify reading matches expected values
-        self.assertAlmostEqual(reading['yaw'], self.expected_values['yaw'], places=2)
-        self.assertAlmostEqual(reading['pitch'], self.expected_values['pitch'], places=2)
-        self.assertAlmostEqual(reading['roll'], self.expected_values['roll'], places=2)
+        self.assertAlmostEqual(reading.yaw, self.expected_values['yaw'], places=2)
+        self.assertAlmostEqual(reading.pitch, self.expected_values['pitch'], places=2)
+        self.assertAlmostEqual(reading.roll, self.expected_values['roll'], places=2)
 
 
 if __name__ == '__main__':
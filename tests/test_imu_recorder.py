@@ -0,0 +1,142 @@
+"""Tests for the IMU recorder."""
+
+import csv
+import os
+import tempfile
+import time
+import unittest
+
+import numpy as np
+
+from xwr68xxisk.imu import IMU
+from xwr68xxisk.imu_recorder import IMURecorder
+
+
+class TestIMURecorder(unittest.TestCase):
+    """Test cases for the IMURecorder class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.imu = IMU('/dev/ttyUSB0', mock_mode=True)
+
+    def tearDown(self):
+        """Clean up test files."""
+        for root, dirs, files in os.walk(self.temp_dir, topdown=False):
+            for name in files:
+                os.remove(os.path.join(root, name))
+            for name in dirs:
+                os.rmdir(os.path.join(root, name))
+        os.rmdir(self.temp_dir)
+
+    def _record(self, buffer_in_memory, num_frames=5):
+        """Record mock IMU frames and return the rows of the written CSV file."""
+        base_filename = os.path.join(self.temp_dir, f"imu_{buffer_in_memory}")
+        recorder = IMURecorder(base_filename, buffer_in_memory=buffer_in_memory)
+        for _ in range(num_frames):
+            recorder.add_frame(next(self.imu))
+        recorder.close()
+
+        with open(f"{base_filename}.csv", newline='') as f:
+            return list(csv.reader(f))
+
+    def test_csv_contents(self):
+        """Test that each frame is written as one row after the header."""
+        for buffer_in_memory in (True, False):
+            with self.subTest(buffer_in_memory=buffer_in_memory):
+                rows = self._record(buffer_in_memory)
+
+                self.assertEqual(rows[0], [
+                    'timestamp_ns', 'frame', 'index',
+                    'yaw', 'pitch', 'roll',
+                    'x_acceleration', 'y_acceleration', 'z_acceleration',
+                    'motion_intent', 'motion_request'
+                ])
+                self.assertEqual(len(rows), 6)
+                self.assertEqual([int(row[1]) for row in rows[1:]], [0, 1, 2, 3, 4])
+                self.assertAlmostEqual(float(rows[1][4]), -1.10, places=2)
+                self.assertEqual(int(rows[1][8]), 977)
+
+    def test_buffer_growth(self):
+        """Test that the in-memory buffer grows past its initial capacity."""
+        rows = self._record(True, num_frames=5000)
+
+        self.assertEqual(len(rows), 5001)
+        self.assertEqual(int(rows[-1][1]), 4999)
+        self.assertEqual(int(rows[-1][2]), 5000 % 256)
+
+    def test_save_only_when_changed(self):
+        """Test that save() rewrites the file only after new frames were added."""
+        base_filename = os.path.join(self.temp_dir, "imu_save")
+        recorder = IMURecorder(base_filename)
+        recorder.add_frame(next(self.imu))
+        recorder.save()
+
+        # A file removed after saving is not rewritten until the data changes
+        os.remove(f"{base_filename}.csv")
+        recorder.close()
+        self.assertFalse(os.path.exists(f"{base_filename}.csv"))
+
+        recorder.add_frame(next(self.imu))
+        recorder.close()
+        with open(f"{base_filename}.csv", newline='') as f:
+            self.assertEqual(len(list(csv.reader(f))), 3)
+
+    def test_bare_filename(self):
+        """Test recording to a filename without a directory component."""
+        cwd = os.getcwd()
+        os.chdir(self.temp_dir)
+        try:
+            recorder = IMURecorder("imu_bare")
+            recorder.add_frame(next(self.imu))
+            recorder.close()
+        finally:
+            os.chdir(cwd)
+        self.assertTrue(os.path.exists(os.path.join(self.temp_dir, "imu_bare.csv")))
+
+    def test_npz_format(self):
+        """Test that npz recordings store one array per column."""
+        base_filename = os.path.join(self.temp_dir, "imu_npz")
+        recorder = IMURecorder(base_filename, buffer_in_memory=False, format_type='npz')
+        self.assertTrue(recorder.buffer_in_memory)
+        for _ in range(5):
+            recorder.add_frame(next(self.imu))
+        recorder.close()
+
+        with np.load(f"{base_filename}.npz") as data:
+            self.assertEqual(set(data.files), {
+                'timestamp_ns', 'frame', 'index',
+                'yaw', 'pitch', 'roll',
+                'x_acceleration', 'y_acceleration', 'z_acceleration',
+                'motion_intent', 'motion_request'
+            })
+            np.testing.assert_array_equal(data['frame'], np.arange(5))
+            np.testing.assert_allclose(data['pitch'], -1.10, rtol=1e-6)
+            np.testing.assert_array_equal(data['z_acceleration'], 977)
+
+    def test_invalid_format(self):
+        """Test that unsupported formats are rejected."""
+        with self.assertRaises(TypeError):
+            IMURecorder(os.path.join(self.temp_dir, "imu_bad"), format_type='json')
+
+    def test_flush_every(self):
+        """Test that rows reach the file every flush_every frames."""
+        base_filename = os.path.join(self.temp_dir, "imu_flush")
+        recorder = IMURecorder(base_filename, buffer_in_memory=False, flush_every=3)
+        for _ in range(3):
+            recorder.add_frame(next(self.imu))
+
+        # Rows are written by a background thread
+        deadline = time.monotonic() + 1.0
+        while True:
+            with open(f"{base_filename}.csv", newline='') as f:
+                num_rows = len(list(csv.reader(f)))
+            if num_rows == 4 or time.monotonic() > deadline:
+                break
+            time.sleep(0.01)
+        self.assertEqual(num_rows, 4)
+        recorder.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,27 @@
+"""Tests for the command line interface."""
+
+import argparse
+import unittest
+
+from xwr68xxisk import main, radar
+
+
+class TestMain(unittest.TestCase):
+    """Test cases for the CLI helpers."""
+
+    def test_bridge_endpoint_defaults(self):
+        """Test that the CLI defaults mirror the radar module."""
+        self.assertEqual(main.DEFAULT_BRIDGE_CONTROL_ENDPOINT, radar.DEFAULT_BRIDGE_CONTROL_ENDPOINT)
+        self.assertEqual(main.DEFAULT_BRIDGE_DATA_ENDPOINT, radar.DEFAULT_BRIDGE_DATA_ENDPOINT)
+
+    def test_validate_serial(self):
+        """Test serial number validation."""
+        self.assertEqual(main.validate_serial('1234ABCD'), '1234ABCD')
+        for value in ('1234abcd', '1234ABC', '1234ABCDE', '1234ABCD\n', ''):
+            with self.subTest(value=value):
+                with self.assertRaises(argparse.ArgumentTypeError):
+                    main.validate_serial(value)
+
+
+if __name__ == '__main__':
+    unittest.main()
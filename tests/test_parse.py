@@ -29,7 +29,31 @@ def test_parse_empty_packet():
 
 def test_parse_point_cloud():
     """Test parsing of point cloud data."""
-    # TODO: Implement with actual test data
+    # Point cloud (TLV type 1) - 16 bytes per point (x, y, z, v as float32)
+    points = np.array([
+        [1.0, 2.0, 0.5, -0.25],
+        [-3.0, 4.0, 0.0, 1.5],
+        [0.0, 0.0, 0.0, 0.0]
+    ], dtype=np.float32)
+    tlv_type = 1
+    tlv_length = points.nbytes
+    
+    packet = bytearray()
+    packet.extend(tlv_type.to_bytes(4, byteorder='little'))
+    packet.extend(tlv_length.to_bytes(4, byteorder='little'))
+    packet.extend(points.tobytes())
+    
+    radar_data = RadarData(MockRadarConnection(packet))
+    
+    x, y, z, v = radar_data.pc
+    np.testing.assert_array_equal(x, points[:, 0])
+    np.testing.assert_array_equal(y, points[:, 1])
+    np.testing.assert_array_equal(z, points[:, 2])
+    np.testing.assert_array_equal(v, points[:, 3])
+    
+    point_cloud = radar_data.to_point_cloud()
+    assert point_cloud.num_points == 3
+    np.testing.assert_allclose(point_cloud.range[:2], [np.sqrt(5.25), 5.0], rtol=1e-6)
 
 def test_parse_range_profile():
     """Test parsing of range profile data."""
@@ -37,7 +61,20 @@ def test_parse_range_profile():
 
 def test_parse_side_info():
     """Test parsing of side information."""
-    # TODO: Implement with actual test data
+    # Side info (TLV type 7) - 4 bytes per point (SNR and noise as int16 in 0.1 dB)
+    side_info = np.array([[125, 30], [-20, 45]], dtype=np.int16)
+    tlv_type = 7
+    tlv_length = side_info.nbytes
+    
+    packet = bytearray()
+    packet.extend(tlv_type.to_bytes(4, byteorder='little'))
+    packet.extend(tlv_length.to_bytes(4, byteorder='little'))
+    packet.extend(side_info.tobytes())
+    
+    radar_data = RadarData(MockRadarConnection(packet))
+    
+    np.testing.assert_allclose(radar_data.snr, [12.5, -2.0], rtol=1e-6)
+    np.testing.assert_allclose(radar_data.noise, [3.0, 4.5], rtol=1e-6)
 
 def test_multiple_tlvs():
     """Test parsing of packet with multiple TLVs."""
@@ -183,4 +220,42 @@ def test_parse_stats_and_temperature():
     for i, expected_temp in enumerate(temp_sensors):
         offset = 8 + i * 2
         parsed_temp = int.from_bytes(radar_data.temperature_stats_data[offset:offset+2], byteorder='little', signed=True)
-        assert parsed_temp == expected_temp 
\ No newline at end of file
+        assert parsed_temp == expected_temp 
+def test_parse_azimuth_heatmap():
+    """Test that the azimuth heatmap holds the magnitude of each [imag, real] pair."""
+    # Azimuth static heatmap (TLV type 4) - 256 range bins x 4 virtual antennas
+    iq = np.tile(np.array([[3, 4], [-6, 8]], dtype=np.int16), (512, 1))
+    tlv_type = 4
+    tlv_length = iq.nbytes
+    
+    packet = bytearray()
+    packet.extend(tlv_type.to_bytes(4, byteorder='little'))
+    packet.extend(tlv_length.to_bytes(4, byteorder='little'))
+    packet.extend(iq.tobytes())
+    
+    radar_data = RadarData(MockRadarConnection(packet))
+    
+    assert radar_data.azimuth_heatmap.shape == (256, 4)
+    assert radar_data.azimuth_heatmap.dtype == np.float32
+    np.testing.assert_allclose(radar_data.azimuth_heatmap[0], [5.0, 10.0, 5.0, 10.0])
+
+def test_parse_range_doppler_heatmap():
+    """Test that the range-Doppler heatmap is shaped from the configuration or the data."""
+    # Range-Doppler heatmap (TLV type 5) - uint16 log magnitude per bin
+    heatmap = np.arange(64 * 16, dtype=np.uint16)
+    tlv_type = 5
+    tlv_length = heatmap.nbytes
+    
+    packet = bytearray()
+    packet.extend(tlv_type.to_bytes(4, byteorder='little'))
+    packet.extend(tlv_length.to_bytes(4, byteorder='little'))
+    packet.extend(heatmap.tobytes())
+    
+    for config_params, shape in [
+        ({'rangeBins': 64, 'num_doppler_bins': 16}, (64, 16)),
+        ({'rangeBins': 64, 'num_doppler_bins': 32}, (64, 16)),  # Doppler bins inferred
+        ({'rangeBins': 48, 'num_doppler_bins': 32}, (32, 32)),  # Square fallback
+    ]:
+        radar_data = RadarData(MockRadarConnection(packet), config_params=config_params)
+        assert radar_data.range_doppler_heatmap.shape == shape
+        np.testing.assert_array_equal(radar_data.range_doppler_heatmap.ravel(), heatmap)
@@ -5,6 +5,7 @@ This module provides a Panel-based view for configuring radar profile settings
 with both basic and expert mode options.
 """
 
+import functools
 import logging
 import param
 import panel as pn
@@ -12,198 +13,180 @@ from panel.widgets import (
     Select, FloatSlider, FloatInput, IntSlider, IntInput, 
     Checkbox, StaticText, Button, TextAreaInput
 )
-from ..radar_config_models import RadarConfig, AntennaConfigEnum, GuiMonitorConfig
+from ..radar_config_models import (
+    RadarConfig, AntennaConfigEnum, GuiMonitorConfig, RADIAL_VELOCITY_RESOLUTION_OPTIONS
+)
 
 # Initialize logger
 logger = logging.getLogger(__name__)
 
-pn.extension()
+# Valid raw values for the antenna selector, checked without raising on a miss
+_ANTENNA_VALUES = frozenset(e.value for e in AntennaConfigEnum)
+# Antenna selector options (label -> enum), shared by all view instances
+_ANTENNA_OPTIONS = {e.value: e for e in AntennaConfigEnum}
+
+# GUI monitor detected-objects modes (label -> guiMonitor value). The default is
+# also used for the GUI monitor config before the expert widgets are built.
+_DETECTED_OBJECTS_OPTIONS = {"None (0)": 0, "Objects + Side Info (1)": 1, "Objects Only (2)": 2}
+_DEFAULT_DETECTED_OBJECTS = 1
+
+# Expert mode widgets (instance attribute names) grouped by the handler that
+# writes their sub-config. The noise profile, heat map and stats checkboxes are
+# not part of the GUI monitor section yet.
+_EXPERT_WIDGET_LINKS = (
+    ('_update_cfar_config', (
+        'cfar_subframe_idx', 'cfar_proc_direction', 'cfar_average_mode', 'cfar_win_len', 'cfar_guard_len',
+        'cfar_noise_div', 'cfar_cyclic_mode', 'cfar_threshold_scale', 'cfar_peak_grouping_en')),
+    ('_update_calib_dc_config', (
+        'calib_dc_enabled', 'calib_dc_negative_bin', 'calib_dc_positive_bin', 'calib_dc_num_avg_frames')),
+    ('_update_aoa_config', ('aoa_min_azimuth', 'aoa_max_azimuth', 'aoa_min_elevation', 'aoa_max_elevation')),
+    ('_update_mob_config', ('mob_enabled', 'mob_threshold')),
+    ('_update_gui_monitor_config', ('gui_detected_objects', 'gui_range_profile_mode')),
+    ('_update_analog_monitor_config', ('analog_rx_saturation', 'analog_sig_img_band')),
+    ('_update_trigger_mode_config', ('trigger_mode_select',)),
+)
 
-class ProfileConfigView(param.Parameterized):
-    """
-    A Panel-based view for configuring the RadarConfig (radar profile section of the unified config).
-    Now supports 'Expert Mode' for advanced/diagnostic parameters with proper form-based editors.
-    """
+# Fixed label/header HTML shared by all view instances
+_ANTENNA_LABEL = "<b>Antenna Config (Azimuth Res - deg)</b>"
+_RVR_LABEL = "Radial Velocity Resolution (m/s)"
+_SCENE_SELECTION_HEADER = "<h2>Scene Selection</h2>"
+_PLOT_SELECTION_HEADER = "<h2>Plot Selection</h2>"
+_ADVANCED_HEADER = "<h2>Advanced/Diagnostic Parameters (Expert Mode)</h2>"
 
-    config = param.ClassSelector(class_=RadarConfig, is_instance=True)
+# Expert sections are separated by a border instead of extra Divider models
+_SECTION_STYLES = {'border-top': '1px solid #ddd', 'padding-top': '5px'}
+
+
+_extension_loaded = False
+
+
+def _ensure_extension():
+    """Load the Panel extension the first time any view is rendered."""
+    global _extension_loaded
+    if not _extension_loaded:
+        pn.extension()
+        _extension_loaded = True
 
-    # Widgets for direct binding if not using pn.Param from Pydantic model directly
-    # This approach gives more control over individual widget types and layout
 
-    # --- Top Configuration Widgets ---
-    antenna_config_select = param.Selector()
+@functools.lru_cache(maxsize=None)
+def _bounds_for(model_cls, field_name, default_ge, default_le):
+    """Return the (ge, le) bounds of a model field, computed once per model class and field."""
+    field_info = model_cls.model_fields[field_name]
+    start_val = None
+    end_val = None
+    for meta_item in getattr(field_info, 'metadata', ()):
+        start_val = getattr(meta_item, 'ge', start_val)
+        end_val = getattr(meta_item, 'le', end_val)
+    return start_val if start_val is not None else default_ge, \
+           end_val if end_val is not None else default_le
 
-    # --- Scene Selection Widgets ---
-    frame_rate_slider = param.ClassSelector(class_=FloatSlider)
-    frame_rate_input = param.ClassSelector(class_=FloatInput)
 
-    range_res_slider = param.ClassSelector(class_=FloatSlider)
-    range_res_input = param.ClassSelector(class_=FloatInput)
+def _snap_to_slider(value, slider):
+    """Clamp a value to the slider range and round it to the slider's step grid."""
+    value = min(max(value, slider.start), slider.end)
+    return round(slider.start + round((value - slider.start) / slider.step) * slider.step, 10)
 
-    max_range_slider = param.ClassSelector(class_=FloatSlider)
-    max_range_input = param.ClassSelector(class_=FloatInput)
 
-    max_vel_slider = param.ClassSelector(class_=FloatSlider)
-    max_vel_input = param.ClassSelector(class_=FloatInput)
+def _section(title, *objects):
+    """Return a titled expert mode section."""
+    return pn.Column(StaticText(value=f"<h3>{title}</h3>"), *objects, styles=_SECTION_STYLES)
 
-    radial_vel_res_label = param.ClassSelector(class_=StaticText)
-    radial_vel_res_select = param.ClassSelector(class_=Select)
-    radial_vel_res_numeric_display = param.ClassSelector(class_=FloatInput)
 
-    # --- Plot Selection Widgets ---
-    plot_scatter_cb = param.ClassSelector(class_=Checkbox)
-    plot_range_profile_cb = param.ClassSelector(class_=Checkbox)
-    plot_range_waterfall_cb = param.ClassSelector(class_=Checkbox)
-    plot_noise_profile_cb = param.ClassSelector(class_=Checkbox)
-    plot_range_azimuth_cb = param.ClassSelector(class_=Checkbox)
-    plot_range_doppler_cb = param.ClassSelector(class_=Checkbox)
-    plot_statistics_cb = param.ClassSelector(class_=Checkbox)
+class ProfileConfigView(param.Parameterized):
+    """
+    A Panel-based view for configuring the RadarConfig (radar profile section of the unified config).
+    Now supports 'Expert Mode' for advanced/diagnostic parameters with proper form-based editors.
+    """
+
+    config = param.ClassSelector(class_=RadarConfig, is_instance=True)
 
     # --- Expert Mode ---
     expert_mode = param.Boolean(default=False, doc="Enable expert/advanced parameter editing.")
 
-    # Advanced/diagnostic widgets (replaced JSON editors with proper form widgets)
-    # CFAR Configuration
-    cfar_subframe_idx = param.ClassSelector(class_=IntInput)
-    cfar_proc_direction = param.ClassSelector(class_=Select)
-    cfar_average_mode = param.ClassSelector(class_=IntInput)
-    cfar_win_len = param.ClassSelector(class_=IntSlider)
-    cfar_guard_len = param.ClassSelector(class_=IntSlider)
-    cfar_noise_div = param.ClassSelector(class_=IntInput)
-    cfar_cyclic_mode = param.ClassSelector(class_=IntInput)
-    cfar_threshold_scale = param.ClassSelector(class_=FloatSlider)
-    cfar_peak_grouping_en = param.ClassSelector(class_=Checkbox)
-    
-    # Calibration DC Range Signal
-    calib_dc_enabled = param.ClassSelector(class_=Checkbox)
-    calib_dc_negative_bin = param.ClassSelector(class_=IntInput)
-    calib_dc_positive_bin = param.ClassSelector(class_=IntInput)
-    calib_dc_num_avg_frames = param.ClassSelector(class_=IntSlider)
-    
-    # AOA FOV Configuration
-    aoa_min_azimuth = param.ClassSelector(class_=FloatSlider)
-    aoa_max_azimuth = param.ClassSelector(class_=FloatSlider)
-    aoa_min_elevation = param.ClassSelector(class_=FloatSlider)
-    aoa_max_elevation = param.ClassSelector(class_=FloatSlider)
-    
-    # Multi-Object Beamforming
-    mob_enabled = param.ClassSelector(class_=Checkbox)
-    mob_threshold = param.ClassSelector(class_=FloatSlider)
-    
-    # GUI Monitor
-    gui_detected_objects = param.ClassSelector(class_=Select)
-    gui_range_profile_mode = param.ClassSelector(class_=Select)
-    gui_noise_profile = param.ClassSelector(class_=Checkbox)
-    gui_range_azimuth_heat_map = param.ClassSelector(class_=Checkbox)
-    gui_range_doppler_heat_map = param.ClassSelector(class_=Checkbox)
-    gui_stats_info = param.ClassSelector(class_=Checkbox)
-    
-    # Analog Monitor
-    analog_rx_saturation = param.ClassSelector(class_=Checkbox)
-    analog_sig_img_band = param.ClassSelector(class_=Checkbox)
-    
-    # Trigger Mode Configuration
-    trigger_mode_select = param.ClassSelector(class_=Select)
+    # The widgets themselves are plain instance attributes created in
+    # _init_widgets/_init_expert_widgets; only config and expert_mode are observed
 
     def __init__(self, config_instance: RadarConfig, **params):
         super().__init__(**params)
         self.config = config_instance
+        # Expert widgets are only built once expert mode is first enabled
+        self._advanced_built = False
+        self._view_cache = None
         self._init_widgets()
-        self._init_expert_widgets()
         self._link_widgets_to_config()
-        self._update_gui_monitor_config(None)
+        # Defer the initial GUI monitor sync until the session has loaded;
+        # Panel runs the callback immediately when there is no server session
+        pn.state.onload(lambda: self._update_gui_monitor_config(None))
 
     def _init_widgets(self):
         # Initialize top selectors
-        self.param.antenna_config_select.objects = list(AntennaConfigEnum)
-        self.antenna_config_select = self.config.antenna_config
+        self.antenna_config_select = Select(
+            name="",
+            options=dict(_ANTENNA_OPTIONS),  # Panel may mutate its options, so pass a copy
+            value=self.config.antenna_config
+        )
 
         # Scene Selection
-        # Helper function to extract ge/le from metadata
-        def get_slider_bounds(field_info, default_ge, default_le):
-            start_val = None
-            end_val = None
-            if field_info and hasattr(field_info, 'metadata'):
-                for meta_item in field_info.metadata:
-                    if hasattr(meta_item, 'ge'):
-                        start_val = meta_item.ge
-                    if hasattr(meta_item, 'le'):
-                        end_val = meta_item.le
-            return start_val if start_val is not None else default_ge, \
-                   end_val if end_val is not None else default_le
+        config_cls = type(self.config)
 
         # Frame Rate
-        frame_rate_field = self.config.model_fields['frame_rate_fps']
-        fr_start, fr_end = get_slider_bounds(frame_rate_field, 1.0, 30.0)
+        fr_start, fr_end = _bounds_for(config_cls, 'frame_rate_fps', 1.0, 30.0)
         self.frame_rate_slider = FloatSlider(
             name="Frame Rate (fps)", 
             start=fr_start, 
             end=fr_end,
-            value=self.config.frame_rate_fps, step=1, bar_color='#FF0000' # Red color from image
+            value=self.config.frame_rate_fps, step=1, bar_color='#FF0000', # Red color from image
+            sizing_mode='stretch_width'
         )
         self.frame_rate_input = FloatInput(
-            name="", value=self.config.frame_rate_fps, width=80
+            name="", value=self.config.frame_rate_fps, width=80, step=1, sizing_mode='fixed'
         )
 
         # Range Resolution
-        range_res_field = self.config.model_fields['range_resolution_m']
-        rr_start, rr_end = get_slider_bounds(range_res_field, 0.039, 0.047)
+        rr_start, rr_end = _bounds_for(config_cls, 'range_resolution_m', 0.039, 0.047)
         self.range_res_slider = FloatSlider(
             name="Range Resolution (m)", 
             start=rr_start,
             end=rr_end,
-            value=self.config.range_resolution_m, step=0.001, format='0.000', bar_color='#FF0000'
+            value=self.config.range_resolution_m, step=0.001, format='0.000', bar_color='#FF0000', sizing_mode='stretch_width'
         )
         self.range_res_input = FloatInput(
-            name="", value=self.config.range_resolution_m, width=80, format='0.000'
+            name="", value=self.config.range_resolution_m, width=80, step=0.001, format='0.000', sizing_mode='fixed'
         )
 
         # Max Unambiguous Range
-        max_range_field = self.config.model_fields['max_unambiguous_range_m']
-        mr_start, mr_end = get_slider_bounds(max_range_field, 3.95, 18.02)
+        mr_start, mr_end = _bounds_for(config_cls, 'max_unambiguous_range_m', 3.95, 18.02)
         self.max_range_slider = FloatSlider(
             name="Maximum Unambiguous Range (m)",
             start=mr_start,
             end=mr_end,
-            value=self.config.max_unambiguous_range_m, step=0.01, format='0.00', bar_color='#FF0000'
+            value=self.config.max_unambiguous_range_m, step=0.01, format='0.00', bar_color='#FF0000', sizing_mode='stretch_width'
         )
         self.max_range_input = FloatInput(
-            name="", value=self.config.max_unambiguous_range_m, width=80, format='0.00'
+            name="", value=self.config.max_unambiguous_range_m, width=80, step=0.01, format='0.00', sizing_mode='fixed'
         )
         
         # Max Radial Velocity
-        max_vel_field = self.config.model_fields['max_radial_velocity_ms']
-        mv_start, mv_end = get_slider_bounds(max_vel_field, 0.27, 6.39)
+        mv_start, mv_end = _bounds_for(config_cls, 'max_radial_velocity_ms', 0.27, 6.39)
         self.max_vel_slider = FloatSlider(
             name="Maximum Radial Velocity (m/s)",
             start=mv_start,
             end=mv_end,
-            value=self.config.max_radial_velocity_ms, step=0.01, format='0.00', bar_color='#FF0000'
+            value=self.config.max_radial_velocity_ms, step=0.01, format='0.00', bar_color='#FF0000', sizing_mode='stretch_width'
         )
         self.max_vel_input = FloatInput(
-            name="", value=self.config.max_radial_velocity_ms, width=80, format='0.00'
+            name="", value=self.config.max_radial_velocity_ms, width=80, step=0.01, format='0.00', sizing_mode='fixed'
         )
         
         # Radial Velocity Resolution
-        self.radial_vel_res_label = StaticText(value="Radial Velocity Resolution (m/s)")
-        # Ensure the initial value for Select is one of its options, otherwise Panel might error or pick first
-        initial_rvr = self.config.radial_velocity_resolution_ms
-        rvr_options = [0.07, 0.13]
-        if initial_rvr not in rvr_options:
-            initial_rvr = rvr_options[0] # Default to first option if current config value isn't valid for select
-            self.config.radial_velocity_resolution_ms = initial_rvr # Update config to match default UI
-            
+        self.radial_vel_res_label = StaticText(value=_RVR_LABEL)
+        # RadarConfig already coerces the value to one of the Select options
         self.radial_vel_res_select = Select(
             name="", 
-            options=rvr_options, 
-            value=initial_rvr,
+            options=list(RADIAL_VELOCITY_RESOLUTION_OPTIONS), 
+            value=self.config.radial_velocity_resolution_ms,
             width=80 # Adjusted width to be similar to FloatInput
         )
-        self.radial_vel_res_numeric_display = FloatInput(
-            name="", 
-            value=initial_rvr, 
-            width=80, format='0.00', disabled=True
-        )
 
         # Plot Selection
         self.plot_scatter_cb = Checkbox(name="Scatter Plot", value=self.config.plot_scatter)
@@ -214,6 +197,9 @@ class ProfileConfigView(param.Parameterized):
         self.plot_range_doppler_cb = Checkbox(name="Range Doppler Heat Map", value=self.config.plot_range_doppler_heat_map)
         self.plot_statistics_cb = Checkbox(name="Statistics", value=self.config.plot_statistics)
 
+        # Expert mode toggle
+        self.expert_toggle = Checkbox(name="Expert Mode (show advanced parameters)", value=self.expert_mode, width=250)
+
     def _init_expert_widgets(self):
         """Initialize expert mode widgets with proper form controls instead of JSON editors."""
         
@@ -245,7 +231,7 @@ class ProfileConfigView(param.Parameterized):
         self.mob_threshold = FloatSlider(name="MOB Threshold", start=0.0, end=1.0, value=0.5, step=0.01, width=200)
         
         # GUI Monitor
-        self.gui_detected_objects = Select(name="Detected Objects", options=["None (0)", "Objects + Side Info (1)", "Objects Only (2)"], value="Objects + Side Info (1)", width=200)
+        self.gui_detected_objects = Select(name="Detected Objects", options=dict(_DETECTED_OBJECTS_OPTIONS), value=_DEFAULT_DETECTED_OBJECTS, width=200)
         # Set initial value based on current config
         initial_mode = "Log Magnitude" if getattr(self.config, 'range_profile_mode', 'log_magnitude') == 'log_magnitude' else "Complex"
         self.gui_range_profile_mode = Select(name="Range Profile Mode", options=["Log Magnitude", "Complex"], value=initial_mode, width=200)
@@ -275,42 +261,51 @@ class ProfileConfigView(param.Parameterized):
 
     def _link_widgets_to_config(self):
         # Link top selectors
-        self.param.watch(self._on_antenna_config_change, 'antenna_config_select')
-
-        # Link Scene Selection sliders and inputs bidirectionally
-        self.frame_rate_slider.param.watch(lambda event: setattr(self.frame_rate_input, 'value', event.new), 'value')
-        self.frame_rate_input.param.watch(lambda event: setattr(self.frame_rate_slider, 'value', event.new), 'value')
-        self.frame_rate_slider.param.watch(lambda event: setattr(self.config, 'frame_rate_fps', event.new), 'value')
-        self.frame_rate_input.param.watch(lambda event: setattr(self.config, 'frame_rate_fps', event.new), 'value')
-        
-        # Add logging for frame rate changes
-        self.frame_rate_slider.param.watch(self._on_frame_rate_change, 'value')
-        self.frame_rate_input.param.watch(self._on_frame_rate_change, 'value')
-
-        self.range_res_slider.param.watch(lambda event: setattr(self.range_res_input, 'value', event.new), 'value')
-        self.range_res_input.param.watch(lambda event: setattr(self.range_res_slider, 'value', event.new), 'value')
-        self.range_res_slider.param.watch(lambda event: setattr(self.config, 'range_resolution_m', event.new), 'value')
-
-        self.max_range_slider.param.watch(lambda event: setattr(self.max_range_input, 'value', event.new), 'value')
-        self.max_range_input.param.watch(lambda event: setattr(self.max_range_slider, 'value', event.new), 'value')
-        self.max_range_slider.param.watch(lambda event: setattr(self.config, 'max_unambiguous_range_m', event.new), 'value')
-
-        self.max_vel_slider.param.watch(lambda event: setattr(self.max_vel_input, 'value', event.new), 'value')
-        self.max_vel_input.param.watch(lambda event: setattr(self.max_vel_slider, 'value', event.new), 'value')
-        self.max_vel_slider.param.watch(lambda event: setattr(self.config, 'max_radial_velocity_ms', event.new), 'value')
+        self.antenna_config_select.param.watch(self._on_antenna_config_change, 'value')
+
+        # Link Scene Selection sliders and inputs bidirectionally. Each slider maps
+        # to its config field and paired input. While dragging, the input is
+        # mirrored in the browser and the config is written once the slider is
+        # released (value_throttled). Typed input values are forwarded to the
+        # slider and the config from Python.
+        self._slider_map = {
+            self.frame_rate_slider: ('frame_rate_fps', self.frame_rate_input),
+            self.range_res_slider: ('range_resolution_m', self.range_res_input),
+            self.max_range_slider: ('max_unambiguous_range_m', self.max_range_input),
+            self.max_vel_slider: ('max_radial_velocity_ms', self.max_vel_input),
+        }
+        self._input_map = {peer: slider for slider, (_, peer) in self._slider_map.items()}
+        for slider, (_, peer) in self._slider_map.items():
+            slider.jslink(peer, value='value')
+            slider.param.watch(self._on_slider_release, 'value_throttled')
+        for input_widget in self._input_map:
+            input_widget.param.watch(self._on_input_change, 'value')
         
         # Radial velocity resolution is now user-settable via Select
-        self.radial_vel_res_select.param.watch(self._on_radial_vel_res_select_change, 'value')
+        self.radial_vel_res_select.param.watch(lambda event: setattr(self.config, 'radial_velocity_resolution_ms', event.new), 'value')
+
+        # Link Plot Selection checkboxes to their config fields
+        self._plot_cb_map = {
+            self.plot_scatter_cb: 'plot_scatter',
+            self.plot_range_profile_cb: 'plot_range_profile',
+            self.plot_range_waterfall_cb: 'plot_range_waterfall',
+            self.plot_noise_profile_cb: 'plot_noise_profile',
+            self.plot_range_azimuth_cb: 'plot_range_azimuth_heat_map',
+            self.plot_range_doppler_cb: 'plot_range_doppler_heat_map',
+            self.plot_statistics_cb: 'plot_statistics',
+        }
+        for checkbox in self._plot_cb_map:
+            checkbox.param.watch(self._on_plot_checkbox_change, 'value')
 
-        # Link Plot Selection checkboxes
-        self.plot_scatter_cb.param.watch(lambda event: setattr(self.config, 'plot_scatter', event.new), 'value')
-        self.plot_range_profile_cb.param.watch(lambda event: setattr(self.config, 'plot_range_profile', event.new), 'value')
-        self.plot_range_waterfall_cb.param.watch(lambda event: setattr(self.config, 'plot_range_waterfall', event.new), 'value')
-        self.plot_noise_profile_cb.param.watch(lambda event: setattr(self.config, 'plot_noise_profile', event.new), 'value')
-        self.plot_range_azimuth_cb.param.watch(lambda event: setattr(self.config, 'plot_range_azimuth_heat_map', event.new), 'value')
-        self.plot_range_doppler_cb.param.watch(lambda event: setattr(self.config, 'plot_range_doppler_heat_map', event.new), 'value')
-        self.plot_statistics_cb.param.watch(lambda event: setattr(self.config, 'plot_statistics', event.new), 'value')
+        # Expert mode toggle
+        self.expert_toggle.param.watch(lambda event: setattr(self, 'expert_mode', event.new), 'value')
 
+    def _link_expert_widgets(self):
+        """Link expert mode widgets to the configuration.
+
+        Widgets are linked from ``_EXPERT_WIDGET_LINKS``. Sliders write the
+        config on release (``value_throttled``) rather than on every drag step.
+        """
         # Link plot selections to GUI monitor widgets directly
         self.plot_range_profile_cb.param.watch(lambda event: setattr(self.gui_range_profile_mode, 'value', event.new), 'value')
         #self.plot_noise_profile_cb.param.watch(lambda event: setattr(self.gui_noise_profile, 'value', event.new), 'value')
@@ -318,58 +313,18 @@ class ProfileConfigView(param.Parameterized):
         #self.plot_range_doppler_cb.param.watch(lambda event: setattr(self.gui_range_doppler_heat_map, 'value', event.new), 'value')
         #self.plot_statistics_cb.param.watch(lambda event: setattr(self.gui_stats_info, 'value', event.new), 'value')
 
-        # Link expert mode widgets to config
-        self._link_expert_widgets()
-
-    def _link_expert_widgets(self):
-        """Link expert mode widgets to the configuration."""
-        # CFAR Configuration
-        self.cfar_subframe_idx.param.watch(self._update_cfar_config, 'value')
-        self.cfar_proc_direction.param.watch(self._update_cfar_config, 'value')
-        self.cfar_average_mode.param.watch(self._update_cfar_config, 'value')
-        self.cfar_win_len.param.watch(self._update_cfar_config, 'value')
-        self.cfar_guard_len.param.watch(self._update_cfar_config, 'value')
-        self.cfar_noise_div.param.watch(self._update_cfar_config, 'value')
-        self.cfar_cyclic_mode.param.watch(self._update_cfar_config, 'value')
-        self.cfar_threshold_scale.param.watch(self._update_cfar_config, 'value')
-        self.cfar_peak_grouping_en.param.watch(self._update_cfar_config, 'value')
-        
-        # Calibration DC Range Signal
-        self.calib_dc_enabled.param.watch(self._update_calib_dc_config, 'value')
-        self.calib_dc_negative_bin.param.watch(self._update_calib_dc_config, 'value')
-        self.calib_dc_positive_bin.param.watch(self._update_calib_dc_config, 'value')
-        self.calib_dc_num_avg_frames.param.watch(self._update_calib_dc_config, 'value')
-        
-        # AOA FOV Configuration
-        self.aoa_min_azimuth.param.watch(self._update_aoa_config, 'value')
-        self.aoa_max_azimuth.param.watch(self._update_aoa_config, 'value')
-        self.aoa_min_elevation.param.watch(self._update_aoa_config, 'value')
-        self.aoa_max_elevation.param.watch(self._update_aoa_config, 'value')
-        
-        # Multi-Object Beamforming
-        self.mob_enabled.param.watch(self._update_mob_config, 'value')
-        self.mob_threshold.param.watch(self._update_mob_config, 'value')
-        
-        # GUI Monitor
-        self.gui_detected_objects.param.watch(self._update_gui_monitor_config, 'value')
-        self.gui_range_profile_mode.param.watch(self._update_gui_monitor_config, 'value')
-        #self.gui_noise_profile.param.watch(self._update_gui_monitor_config, 'value')
-        #self.gui_range_azimuth_heat_map.param.watch(self._update_gui_monitor_config, 'value')
-        #self.gui_range_doppler_heat_map.param.watch(self._update_gui_monitor_config, 'value')
-        #self.gui_stats_info.param.watch(self._update_gui_monitor_config, 'value')
-        
-        # Analog Monitor
-        self.analog_rx_saturation.param.watch(self._update_analog_monitor_config, 'value')
-        self.analog_sig_img_band.param.watch(self._update_analog_monitor_config, 'value')
-        
-        # Trigger Mode
-        self.trigger_mode_select.param.watch(self._update_trigger_mode_config, 'value')
+        # Every other expert widget re-syncs its sub-config through one handler
+        for handler_name, widget_names in _EXPERT_WIDGET_LINKS:
+            handler = getattr(self, handler_name)
+            for widget_name in widget_names:
+                widget = getattr(self, widget_name)
+                widget.param.watch(handler, 'value_throttled' if isinstance(widget, (IntSlider, FloatSlider)) else 'value')
 
     def _update_cfar_config(self, event):
         """Update CFAR configuration from widget values."""
         if not hasattr(self.config, 'cfar_cfg') or self.config.cfar_cfg is None:
             from ..radar_config_models import CfarConfig
-            self.config.cfar_cfg = CfarConfig(
+            self.config.cfar_cfg = CfarConfig.model_construct(
                 subframe_idx=self.cfar_subframe_idx.value,
                 proc_direction=0 if "Range" in self.cfar_proc_direction.value else 1,
                 average_mode=self.cfar_average_mode.value,
@@ -395,7 +350,7 @@ class ProfileConfigView(param.Parameterized):
         """Update Calibration DC Range Signal configuration from widget values."""
         if not hasattr(self.config, 'calib_dc_range_sig') or self.config.calib_dc_range_sig is None:
             from ..radar_config_models import CalibDcRangeSigConfig
-            self.config.calib_dc_range_sig = CalibDcRangeSigConfig(
+            self.config.calib_dc_range_sig = CalibDcRangeSigConfig.model_construct(
                 subframe_idx=-1,
                 enabled=self.calib_dc_enabled.value,
                 negative_bin_idx=self.calib_dc_negative_bin.value,
@@ -412,7 +367,7 @@ class ProfileConfigView(param.Parameterized):
         """Update AOA FOV configuration from widget values."""
         if not hasattr(self.config, 'aoa_fov_cfg') or self.config.aoa_fov_cfg is None:
             from ..radar_config_models import AoaFovConfig
-            self.config.aoa_fov_cfg = AoaFovConfig(
+            self.config.aoa_fov_cfg = AoaFovConfig.model_construct(
                 subframe_idx=-1,
                 min_azimuth_deg=self.aoa_min_azimuth.value,
                 max_azimuth_deg=self.aoa_max_azimuth.value,
@@ -429,7 +384,7 @@ class ProfileConfigView(param.Parameterized):
         """Update Multi-Object Beamforming configuration from widget values."""
         if not hasattr(self.config, 'multi_obj_beam_forming') or self.config.multi_obj_beam_forming is None:
             from ..radar_config_models import MultiObjBeamFormingConfig
-            self.config.multi_obj_beam_forming = MultiObjBeamFormingConfig(
+            self.config.multi_obj_beam_forming = MultiObjBeamFormingConfig.model_construct(
                 subframe_idx=-1,
                 enabled=self.mob_enabled.value,
                 threshold=self.mob_threshold.value
@@ -441,22 +396,34 @@ class ProfileConfigView(param.Parameterized):
     def _update_gui_monitor_config(self, event):
         """Update GUI monitor configuration based on widget values."""
         try:
-            # Parse detected objects value
-            detected_objects = int(self.gui_detected_objects.value.split('(')[1].split(')')[0])
-            
-            # Update config with new GUI monitor settings
-            self.config.gui_monitor = GuiMonitorConfig(
+            if self._advanced_built:
+                detected_objects = self.gui_detected_objects.value
+                range_profile_mode = "log_magnitude" if self.gui_range_profile_mode.value == "Log Magnitude" else "complex"
+            else:
+                # Expert widgets not built yet, use their defaults
+                detected_objects = _DEFAULT_DETECTED_OBJECTS
+                range_profile_mode = getattr(self.config, 'range_profile_mode', 'log_magnitude')
+
+            gui_monitor_values = dict(
                 detected_objects=detected_objects,
                 range_profile_enabled=self.config.plot_range_profile,  # Use the main config setting
-                range_profile_mode="log_magnitude" if self.gui_range_profile_mode.value == "Log Magnitude" else "complex",
+                range_profile_mode=range_profile_mode,
                 noise_profile=getattr(self, 'gui_noise_profile', None) and self.gui_noise_profile.value or False,
                 range_azimuth_heat_map=getattr(self, 'gui_range_azimuth_heat_map', None) and self.gui_range_azimuth_heat_map.value or False,
                 range_doppler_heat_map=getattr(self, 'gui_range_doppler_heat_map', None) and self.gui_range_doppler_heat_map.value or False,
                 stats_info=getattr(self, 'gui_stats_info', None) and self.gui_stats_info.value or True
             )
+
+            # Update the existing GUI monitor settings in place; widget values are
+            # already typed, so a new model is only constructed (unvalidated) if missing
+            if isinstance(self.config.gui_monitor, GuiMonitorConfig):
+                for name, value in gui_monitor_values.items():
+                    setattr(self.config.gui_monitor, name, value)
+            else:
+                self.config.gui_monitor = GuiMonitorConfig.model_construct(**gui_monitor_values)
             
             # Also update the main config plot settings to match (only if widgets exist)
-            self.config.range_profile_mode = "log_magnitude" if self.gui_range_profile_mode.value == "Log Magnitude" else "complex"
+            self.config.range_profile_mode = range_profile_mode
             if hasattr(self, 'gui_noise_profile') and self.gui_noise_profile is not None:
                 self.config.plot_noise_profile = self.gui_noise_profile.value
             if hasattr(self, 'gui_range_azimuth_heat_map') and self.gui_range_azimuth_heat_map is not None:
@@ -473,7 +440,7 @@ class ProfileConfigView(param.Parameterized):
         """Update Analog Monitor configuration from widget values."""
         if not hasattr(self.config, 'analog_monitor') or self.config.analog_monitor is None:
             from ..radar_config_models import AnalogMonitorConfig
-            self.config.analog_monitor = AnalogMonitorConfig(
+            self.config.analog_monitor = AnalogMonitorConfig.model_construct(
                 rx_saturation=self.analog_rx_saturation.value,
                 sig_img_band=self.analog_sig_img_band.value
             )
@@ -504,26 +471,41 @@ class ProfileConfigView(param.Parameterized):
         # event.new is now an AntennaConfigEnum instance
         if isinstance(event.new, AntennaConfigEnum):
             self.config.antenna_config = event.new
+            return
+        if event.new in _ANTENNA_VALUES:
+            self.config.antenna_config = AntennaConfigEnum(event.new)
         else:
-            try:
-                self.config.antenna_config = AntennaConfigEnum(event.new)
-            except ValueError:
-                self.config.antenna_config = AntennaConfigEnum.CFG_4RX_3TX_15DEG_ELEV
-    
-    def _on_radial_vel_res_select_change(self, event):
-        """Handles changes from the radial velocity resolution Select widget."""
-        new_val = event.new
-        self.config.radial_velocity_resolution_ms = new_val
-        self.radial_vel_res_numeric_display.value = new_val
+            self.config.antenna_config = AntennaConfigEnum.CFG_4RX_3TX_15DEG_ELEV
     
-    def _on_frame_rate_change(self, event):
-        """Handles changes from the frame rate slider/input widgets."""
-        import logging
-        logger = logging.getLogger(__name__)
-        new_fps = event.new
-        frame_period_ms = 1000.0 / new_fps
-        logger.info(f"ProfileConfigView frame rate changed: {new_fps:.1f} fps = {frame_period_ms:.1f} ms")
-        self.config.frame_rate_fps = new_fps
+    def _on_slider_release(self, event):
+        """Writes the released scene slider value to the config."""
+        self._write_scene_value(self._slider_map[event.obj][0], event.new)
+
+    def _on_input_change(self, event):
+        """Forwards a typed scene input value to its slider and the config."""
+        if event.new is None:
+            return
+        slider = self._input_map[event.obj]
+        value = _snap_to_slider(event.new, slider)
+        if value != event.new:
+            # Re-enters with the value on the slider grid
+            event.obj.value = value
+            return
+        if value == slider.value:
+            # Echo of a slider drag (written on release) or a sub-step edit
+            return
+        slider.value = value
+        self._write_scene_value(self._slider_map[slider][0], value)
+
+    def _on_plot_checkbox_change(self, event):
+        """Writes a plot selection checkbox to its config field."""
+        setattr(self.config, self._plot_cb_map[event.obj], event.new)
+
+    def _write_scene_value(self, name, value):
+        """Writes a scene selection value to the config."""
+        setattr(self.config, name, value)
+        if name == 'frame_rate_fps' and logger.isEnabledFor(logging.INFO):
+            logger.info("ProfileConfigView frame rate changed: %.1f fps = %.1f ms", value, 1000.0 / value)
 
     def _create_widget_cache(self):
         """Create and cache widgets to prevent recreation."""
@@ -534,7 +516,8 @@ class ProfileConfigView(param.Parameterized):
         top_config = self._create_top_config_layout()
         scene_selection = self._create_scene_selection_layout()
         plot_selection = self._create_plot_selection_layout()
-        advanced_section = self._create_advanced_section_layout()
+        # Placeholder, filled by _build_advanced_section on first use
+        advanced_section = pn.Column(visible=False)
         
         self._widget_cache = {
             'top_config': top_config,
@@ -543,31 +526,40 @@ class ProfileConfigView(param.Parameterized):
             'advanced_section': advanced_section
         }
         return self._widget_cache
+
+    def _build_advanced_section(self):
+        """Create, link and lay out the expert widgets the first time they are needed."""
+        if self._advanced_built:
+            return
+        self._init_expert_widgets()
+        self._link_expert_widgets()
+        self._create_widget_cache()['advanced_section'][:] = self._create_advanced_section_layout().objects
+        self._advanced_built = True
     
     def _create_top_config_layout(self):
         """Create top configuration layout."""
         return pn.Row(
             pn.Column(
-                StaticText(value="<b>Antenna Config (Azimuth Res - deg)</b>"), 
-                pn.Param(self.param.antenna_config_select, widgets={ 'antenna_config_select': pn.widgets.Select})
+                StaticText(value=_ANTENNA_LABEL), 
+                self.antenna_config_select
             )
         )
     
     def _create_scene_selection_layout(self):
         """Create scene selection layout."""
         return pn.Column(
-            StaticText(value="<h2>Scene Selection</h2>"),
-            pn.Row(self.frame_rate_slider, self.frame_rate_input, sizing_mode='stretch_width'),
-            pn.Row(self.range_res_slider, self.range_res_input, sizing_mode='stretch_width'),
-            pn.Row(self.max_range_slider, self.max_range_input, sizing_mode='stretch_width'),
-            pn.Row(self.max_vel_slider, self.max_vel_input, sizing_mode='stretch_width'),
-            pn.Row(self.radial_vel_res_label, self.radial_vel_res_select, self.radial_vel_res_numeric_display, sizing_mode='stretch_width')
+            StaticText(value=_SCENE_SELECTION_HEADER),
+            pn.Row(self.frame_rate_slider, self.frame_rate_input),
+            pn.Row(self.range_res_slider, self.range_res_input),
+            pn.Row(self.max_range_slider, self.max_range_input),
+            pn.Row(self.max_vel_slider, self.max_vel_input),
+            pn.Row(self.radial_vel_res_label, self.radial_vel_res_select, sizing_mode='stretch_width')
         )
     
     def _create_plot_selection_layout(self):
         """Create plot selection layout."""
         return pn.Column(
-            StaticText(value="<h2>Plot Selection</h2>"),
+            StaticText(value=_PLOT_SELECTION_HEADER),
             pn.Row(
                 pn.Column(
                     self.plot_scatter_cb,
@@ -582,78 +574,84 @@ class ProfileConfigView(param.Parameterized):
     def _create_advanced_section_layout(self):
         """Create advanced section layout."""
         return pn.Column(
-            pn.pane.Markdown("## Advanced/Diagnostic Parameters (Expert Mode)"),
-            
-            # CFAR Configuration
-            pn.pane.Markdown("### CFAR Detection Configuration"),
-            pn.Row(
-                pn.Column(self.cfar_subframe_idx, self.cfar_proc_direction, self.cfar_average_mode),
-                pn.Column(self.cfar_win_len, self.cfar_guard_len, self.cfar_noise_div),
-                pn.Column(self.cfar_cyclic_mode, self.cfar_threshold_scale, self.cfar_peak_grouping_en)
+            StaticText(value=_ADVANCED_HEADER),
+            _section(
+                "CFAR Detection Configuration",
+                pn.Row(
+                    pn.Column(self.cfar_subframe_idx, self.cfar_proc_direction, self.cfar_average_mode),
+                    pn.Column(self.cfar_win_len, self.cfar_guard_len, self.cfar_noise_div),
+                    pn.Column(self.cfar_cyclic_mode, self.cfar_threshold_scale, self.cfar_peak_grouping_en)
+                )
             ),
-            
-            pn.layout.Divider(),
-            
-            # Calibration DC Range Signal
-            pn.pane.Markdown("### Calibration DC Range Signal"),
-            pn.Row(
-                pn.Column(self.calib_dc_enabled, self.calib_dc_negative_bin, self.calib_dc_positive_bin),
-                pn.Column(self.calib_dc_num_avg_frames)
+            _section(
+                "Calibration DC Range Signal",
+                pn.Row(
+                    pn.Column(self.calib_dc_enabled, self.calib_dc_negative_bin, self.calib_dc_positive_bin),
+                    pn.Column(self.calib_dc_num_avg_frames)
+                )
             ),
-            
-            pn.layout.Divider(),
-            
-            # AOA FOV Configuration
-            pn.pane.Markdown("### Angle of Arrival FOV Configuration"),
-            pn.Row(
-                pn.Column(self.aoa_min_azimuth, self.aoa_max_azimuth),
-                pn.Column(self.aoa_min_elevation, self.aoa_max_elevation)
+            _section(
+                "Angle of Arrival FOV Configuration",
+                pn.Row(
+                    pn.Column(self.aoa_min_azimuth, self.aoa_max_azimuth),
+                    pn.Column(self.aoa_min_elevation, self.aoa_max_elevation)
+                )
             ),
-            
-            pn.layout.Divider(),
-            
-            # Multi-Object Beamforming
-            pn.pane.Markdown("### Multi-Object Beamforming"),
-            pn.Row(self.mob_enabled, self.mob_threshold),
-            
-            pn.layout.Divider(),
-            
-            # GUI Monitor
-            pn.pane.Markdown("### GUI Monitor Configuration"),
-            pn.Row(
-                pn.Column(self.gui_detected_objects, self.gui_range_profile_mode),
-                pn.Column(self.gui_noise_profile, self.gui_range_azimuth_heat_map, self.gui_range_doppler_heat_map, self.gui_stats_info)
+            _section(
+                "Multi-Object Beamforming",
+                pn.Row(self.mob_enabled, self.mob_threshold)
             ),
-            
-            pn.layout.Divider(),
-            
-            # Analog Monitor
-            pn.pane.Markdown("### Analog Monitor Configuration"),
-            pn.Row(self.analog_rx_saturation, self.analog_sig_img_band),
-            
-            pn.layout.Divider(),
-            
-            # Trigger Mode Configuration
-            pn.pane.Markdown("### Trigger Mode Configuration"),
-            pn.Row(self.trigger_mode_select)
+            _section(
+                "GUI Monitor Configuration",
+                pn.Row(
+                    pn.Column(self.gui_detected_objects, self.gui_range_profile_mode),
+                    #pn.Column(self.gui_noise_profile, self.gui_range_azimuth_heat_map, self.gui_range_doppler_heat_map, self.gui_stats_info)
+                )
+            ),
+            _section(
+                "Analog Monitor Configuration",
+                pn.Row(self.analog_rx_saturation, self.analog_sig_img_band)
+            ),
+            _section(
+                "Trigger Mode Configuration",
+                pn.Row(self.trigger_mode_select)
+            )
         )
 
-    @pn.depends('expert_mode')
+    @param.depends('expert_mode', watch=True)
+    def _update_expert_visibility(self):
+        """Shows or hides the advanced section without rebuilding the layout."""
+        if self.expert_mode:
+            self._build_advanced_section()
+        self.expert_toggle.value = self.expert_mode
+        self._create_widget_cache()['advanced_section'].visible = self.expert_mode
+
+    @property
     def view(self):
+        """The root layout, built on first access and reused afterwards."""
+        if self._view_cache is None:
+            self._view_cache = self._build_view()
+        return self._view_cache
+
+    def __panel__(self):
+        return self.view
+
+    def _build_view(self):
+        """Create the root layout."""
+        # Load the Panel extension only once a view is actually rendered
+        _ensure_extension()
+
         # Use cached widgets
         cache = self._create_widget_cache()
-        
-        expert_toggle = pn.widgets.Checkbox(name="Expert Mode (show advanced parameters)", value=self.expert_mode, width=250)
-        def _toggle_expert(event):
-            self.expert_mode = event.new
-        expert_toggle.param.watch(_toggle_expert, 'value')
 
         # Advanced section visibility depends on expert_mode
+        if self.expert_mode:
+            self._build_advanced_section()
         advanced_section = cache['advanced_section']
         advanced_section.visible = self.expert_mode
 
         return pn.Column(
-            expert_toggle,
+            self.expert_toggle,
             cache['top_config'],
             pn.layout.Divider(),
             cache['scene_selection'],
@@ -666,6 +664,8 @@ class ProfileConfigView(param.Parameterized):
 
 # Example of how to use this view
 if __name__ == "__main__":
+    pn.extension()
+
     # Create a default config instance
     default_config = RadarConfig()
 
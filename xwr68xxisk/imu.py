@@ -34,65 +34,135 @@ Note: Rotations should be applied in order: yaw, pitch, then roll.
 
 """
 
+import collections
 import serial
 import struct
 import threading
-import time
+from typing import NamedTuple
+
+# Frame sync pattern, also used to resynchronize after a dropped byte
+_HEADER_BYTES = b'\xAA\xAA'
+
+# Angles are sent in 0.01 degree steps
+_DEG_PER_LSB = 0.01
+
+# Serial read timeout, bounds how long close() waits for the reader thread
+_READ_TIMEOUT_S = 0.1
+
+# Number of decoded samples kept for consumers that fall behind (2.5 s at 100 Hz)
+_SAMPLE_BUFFER_SIZE = 256
+
+# Complete 19-byte message, little-endian (the 0xAAAA header reads the same either way)
+_FRAME = struct.Struct('<HB3h3hBBBB')
+
+
+class IMUSample(NamedTuple):
+    """A single decoded IMU message."""
+    index: int
+    yaw: float
+    pitch: float
+    roll: float
+    x_acceleration: int
+    y_acceleration: int
+    z_acceleration: int
+    motion_intent: int
+    motion_request: int
 
 
 class IMU:
     """BNO086 IMU interface that provides continuous reading of sensor data via UART.
     
-    The class creates a background thread that reads data at 100Hz and provides access
-    to the latest readings through an iterator interface.
+    The class creates a background thread that reads data at 100Hz and queues the
+    readings for an iterator interface; next() blocks until a reading is available.
     
-    Returns data as a dictionary with keys:
+    Returns data as an IMUSample with fields:
     - index: packet counter
     - yaw, pitch, roll: orientation in degrees
     - x_acceleration, y_acceleration, z_acceleration: acceleration in mg
     - motion_intent, motion_request: BNO086 specific flags
     """
 
-    def __init__(self, port, mock_mode=False):
+    __slots__ = ('mock_mode', 'verify_checksum', 'mock_index', 'sample', 'ser', 'thread',
+                 '_samples', '_samples_cv', '_reading', '_stop')
+
+    def __init__(self, port, mock_mode=False, verify_checksum=True):
         """Initialize IMU interface.
         
         Args:
             port: Serial port for IMU connection
             mock_mode: If True, return test data instead of reading from hardware
+            verify_checksum: If False, skip the per-message checksum check
         """
         self.mock_mode = mock_mode
+        self.verify_checksum = verify_checksum
         self.mock_index = 0
         
         if not mock_mode:
-            self.ser = serial.Serial(port, 115200)
-            self.buffer = []
-            self.thread = threading.Thread(target=self.read_thread)
+            # Reads block at the sensor's output rate, the timeout only lets the
+            # reader thread notice close()
+            self.ser = serial.Serial(port, 115200, timeout=_READ_TIMEOUT_S)
+            self._stop = threading.Event()
+            self._samples = collections.deque(maxlen=_SAMPLE_BUFFER_SIZE)
+            self._samples_cv = threading.Condition()
+            self._reading = True
+            self.thread = threading.Thread(target=self.read_thread, daemon=True)
             self.thread.start()
         else:
             # Initialize with test data
-            self.imu_dict = {
-                'index': 0,
-                'yaw': 0.01,
-                'pitch': -1.10,
-                'roll': 20.85,
-                'x_acceleration': -371,
-                'y_acceleration': -20,
-                'z_acceleration': 977,
-                'motion_intent': 0,
-                'motion_request': 0
-            }
+            self.sample = IMUSample(
+                index=0,
+                yaw=0.01,
+                pitch=-1.10,
+                roll=20.85,
+                x_acceleration=-371,
+                y_acceleration=-20,
+                z_acceleration=977,
+                motion_intent=0,
+                motion_request=0
+            )
 
     def read_thread(self):
-        """Continuously read IMU data in background thread."""
-        while True:
-            if not self.mock_mode:
-                # Read exactly 19 bytes for a complete message
-                data = self.ser.read(19)
-                # decode the data into a dictionary
-                decoded = self.decode_data(data)
-                if decoded is not None:
-                    self.imu_dict = decoded
-            time.sleep(0.01)  # 100Hz update rate
+        """Continuously read IMU data in background thread.
+        
+        Everything the port has buffered is read at once and decoded in one pass.
+        Each message is located by its header, so the stream resynchronizes
+        if a byte is lost instead of staying misaligned.
+        """
+        rx = bytearray()
+        try:
+            while not self._stop.is_set():
+                # Wait for at least one message, but take whatever else is pending
+                rx += self.ser.read(max(_FRAME.size, self.ser.in_waiting))
+                batch = []
+                start = 0
+                while True:
+                    # Skip ahead to the next header
+                    pos = rx.find(_HEADER_BYTES, start)
+                    if pos < 0:
+                        # Keep a trailing 0xAA, it may be the first half of a header
+                        start = max(start, len(rx) - 1) if rx.endswith(b'\xAA') else len(rx)
+                        break
+                    if pos + _FRAME.size > len(rx):
+                        # Incomplete message, finish it on the next read
+                        start = pos
+                        break
+                    decoded = self.decode_data(rx[pos:pos + _FRAME.size])
+                    if decoded is None:
+                        # False header, resume the search one byte later
+                        start = pos + 1
+                        continue
+                    batch.append(decoded)
+                    start = pos + _FRAME.size
+                del rx[:start]
+                if batch:
+                    with self._samples_cv:
+                        self._samples.extend(batch)
+                        self._samples_cv.notify_all()
+        finally:
+            # Wake up waiting consumers so they can stop iterating
+            with self._samples_cv:
+                self._reading = False
+                self._samples_cv.notify_all()
 
     def decode_data(self, data):
         """Decode the 19-byte IMU message.
@@ -101,7 +171,7 @@ class IMU:
             data (bytes): 19-byte message from IMU
             
         Returns:
-            dict: Dictionary containing decoded IMU values
+            IMUSample: Decoded IMU values, or None if the message is invalid
             
         The message format is:
         - Header (2 bytes): 0xAAAA
@@ -118,55 +188,51 @@ class IMU:
         - Checksum (1 byte)
         """
         # Check if we have a complete message
-        if len(data) != 19:
+        if len(data) != _FRAME.size:
             return None
             
-        # Check header
-        header = struct.unpack('>H', data[0:2])[0]
-        if header != 0xAAAA:
+        # Check header before unpacking anything
+        if data[0] != 0xAA or data[1] != 0xAA:
             return None
-            
-        # Unpack all fields at once using little-endian format
-        index, yaw, pitch, roll, x_accel, y_accel, z_accel, motion_intent, motion_request, reserved, checksum = \
-            struct.unpack('<Bhhh hhh BB B B', data[2:])
-            
+
+        # Unpack all fields at once
+        _, index, yaw, pitch, roll, x_accel, y_accel, z_accel, motion_intent, motion_request, reserved, checksum = \
+            _FRAME.unpack_from(data)
+
         # Calculate checksum
-        calc_checksum = sum(data[2:18]) & 0xFF
-        if calc_checksum != checksum:
+        # (memoryview avoids copying the payload)
+        if self.verify_checksum and sum(memoryview(data)[2:18]) & 0xFF != checksum:
             return None
             
         # Convert angular values to degrees
-        yaw = yaw / 100.0
-        pitch = pitch / 100.0
-        roll = roll / 100.0
-            
-        return {
-            'index': index,
-            'yaw': yaw,
-            'pitch': pitch,
-            'roll': roll,
-            'x_acceleration': x_accel,
-            'y_acceleration': y_accel,
-            'z_acceleration': z_accel,
-            'motion_intent': motion_intent,
-            'motion_request': motion_request
-        }
+        return IMUSample(index, yaw * _DEG_PER_LSB, pitch * _DEG_PER_LSB, roll * _DEG_PER_LSB,
+                         x_accel, y_accel, z_accel, motion_intent, motion_request)
 
     def __iter__(self):
         """Return an iterator over IMU data."""
         return self
 
     def __next__(self):
-        """Return the next IMU reading."""
+        """Return the next IMU reading, waiting for one if none is queued."""
         if self.mock_mode:
             # Update mock index
             self.mock_index = (self.mock_index + 1) % 256
-            self.imu_dict['index'] = self.mock_index
-            return self.imu_dict
-        elif hasattr(self, 'imu_dict'):
-            return self.imu_dict
+            self.sample = self.sample._replace(index=self.mock_index)
+            return self.sample
+        with self._samples_cv:
+            self._samples_cv.wait_for(lambda: self._samples or not self._reading)
+            if self._samples:
+                return self._samples.popleft()
         raise StopIteration
 
+    def close(self):
+        """Stop the reader thread and close the serial port."""
+        if self.mock_mode:
+            return
+        self._stop.set()
+        self.thread.join()
+        self.ser.close()
+
     def read(self):
         """Read raw data from the serial port."""
         if self.mock_mode:
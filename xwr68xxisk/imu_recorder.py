@@ -1,145 +1,204 @@
 """IMU data recorder.
 
-This module provides functionality to record IMU data to CSV files. The IMU data includes
+This module provides functionality to record IMU data to CSV or NumPy .npz files. The IMU data includes
 orientation (yaw, pitch, roll) and acceleration (x, y, z) values, along with motion intent
 and request flags.
 """
 
 import os
+import queue
+import sys
+import threading
 import time
-import csv
-from typing import Optional, Dict, Any
+from typing import Optional, Literal
 from dataclasses import dataclass
 from datetime import datetime
 import logging
+import numpy as np
 
-from .imu import IMU
+from .imu import IMU, IMUSample
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# CSV columns; the IMU values follow in IMUSample field order
+_CSV_FIELDS = ('timestamp_ns', 'frame') + IMUSample._fields
+
+# Frames waiting for the writer thread before new ones are dropped (about 10 s at 100 Hz)
+_WRITE_QUEUE_SIZE = 1024
+
+# Streaming file buffer, holds several minutes of rows at 100 Hz
+_CSV_BUFFER_SIZE = 1 << 20
+
+# In-memory frame record, one field per CSV column
+_FRAME_DTYPE = np.dtype([
+    ('timestamp_ns', np.int64),
+    ('frame', np.int32),
+    ('index', np.uint8),
+    ('yaw', np.float32),
+    ('pitch', np.float32),
+    ('roll', np.float32),
+    ('x_acceleration', np.int16),
+    ('y_acceleration', np.int16),
+    ('z_acceleration', np.int16),
+    ('motion_intent', np.uint8),
+    ('motion_request', np.uint8)
+])
+
+# Angles have 0.01 degree resolution, everything else is an integer
+_CSV_FORMAT = ['%d', '%d', '%d', '%.2f', '%.2f', '%.2f', '%d', '%d', '%d', '%d', '%d']
+
+# All fields are numeric, so streamed rows are formatted directly without csv quoting
+_CSV_HEADER = ','.join(_CSV_FIELDS) + '\n'
+_CSV_ROW = ','.join(_CSV_FORMAT) + '\n'
+
+# Buffered frames are stored in preallocated chunks (about 40 s at 100 Hz each), so
+# a long recording never has to copy what it already holds to grow
+_FRAME_CHUNK_SIZE = 4096
+
+@dataclass(slots=True, frozen=True)
 class IMUFrame:
     """Class to store a single frame of IMU data."""
     timestamp_ns: int
     frame_number: int
-    data: Dict[str, Any]
+    data: IMUSample
 
 class IMURecorder:
-    """Class to handle recording IMU data to CSV files."""
+    """Class to handle recording IMU data to CSV or NumPy files."""
     
-    def __init__(self, base_filename: str, buffer_in_memory: bool = True):
+    def __init__(self, base_filename: str, buffer_in_memory: bool = True, flush_every: int = 0,
+                 format_type: Literal['csv', 'npz'] = 'csv'):
         """Initialize the IMU recorder.
         
         Args:
             base_filename: Base filename without extension
             buffer_in_memory: Whether to buffer frames in memory before saving
+            flush_every: When writing directly to file, flush after every N frames
+                (0 leaves flushing to the file buffer and close())
+            format_type: Type of file format to save ('csv' or 'npz'). 'npz' stores one
+                compressed binary array per column and always buffers in memory.
         """
+        if format_type not in ['csv', 'npz']:
+            raise TypeError(f"Unsupported format type: {format_type}. Must be one of: csv, npz")
+        
         self.base_filename = base_filename
-        self.buffer_in_memory = buffer_in_memory
+        self.format_type = format_type
+        self.buffer_in_memory = buffer_in_memory or format_type == 'npz'
+        self.flush_every = flush_every
         
-        # Create output directory if it doesn't exist
-        os.makedirs(os.path.dirname(base_filename), exist_ok=True)
+        # Create output directory if it doesn't exist (none for a bare filename)
+        output_dir = os.path.dirname(base_filename)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
         
         # Initialize storage
-        self.frames: List[IMUFrame] = []
+        self._frame_chunks = []
         self.csv_file = None
         self.frame_count = 0
+        self._saved_frame_count = None
         
-        # Open file if not buffering in memory
+        # Timestamps are wall-clock time at start plus monotonic elapsed time, so a
+        # clock adjustment during recording cannot make them jump
+        self._start_wall_ns = time.time_ns()
+        self._start_monotonic_ns = time.monotonic_ns()
+        
+        # Open file if not buffering in memory; rows are written by a background
+        # thread so file I/O never delays add_frame()
         if not self.buffer_in_memory:
-            self.csv_file = open(f"{base_filename}.csv", 'w', newline='')
+            self.csv_file = open(f"{base_filename}.csv", 'w', newline='', buffering=_CSV_BUFFER_SIZE)
             self._write_csv_header()
+            self._write_queue = queue.Queue(maxsize=_WRITE_QUEUE_SIZE)
+            self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+            self._writer_thread.start()
     
     def _write_csv_header(self):
         """Write the CSV header."""
-        fieldnames = [
-            'timestamp_ns', 'frame', 'index',
-            'yaw', 'pitch', 'roll',
-            'x_acceleration', 'y_acceleration', 'z_acceleration',
-            'motion_intent', 'motion_request'
-        ]
-        self.csv_writer = csv.DictWriter(self.csv_file, fieldnames=fieldnames)
-        self.csv_writer.writeheader()
-
-    def add_frame(self, imu_data: Dict[str, Any]) -> None:
+        self.csv_file.write(_CSV_HEADER)
+
+    @property
+    def frames(self) -> np.ndarray:
+        """Frames buffered in memory, as a structured array with one field per CSV column."""
+        if not self._frame_chunks:
+            return np.empty(0, dtype=_FRAME_DTYPE)
+        return np.concatenate(self._frame_chunks)[:self.frame_count]
+
+    def add_frame(self, imu_data: IMUSample) -> None:
         """Add a new frame of IMU data.
         
         Args:
-            imu_data: Dictionary containing IMU measurements
+            imu_data: Decoded IMU measurements
         """
-        frame = IMUFrame(
-            timestamp_ns=time.time_ns(),
-            frame_number=self.frame_count,
-            data=imu_data
-        )
+        timestamp_ns = self._start_wall_ns + (time.monotonic_ns() - self._start_monotonic_ns)
         
         if self.buffer_in_memory:
-            self.frames.append(frame)
+            chunk_index = self.frame_count % _FRAME_CHUNK_SIZE
+            if chunk_index == 0:
+                self._frame_chunks.append(np.empty(_FRAME_CHUNK_SIZE, dtype=_FRAME_DTYPE))
+            self._frame_chunks[-1][chunk_index] = (timestamp_ns, self.frame_count, *imu_data)
         else:
-            self._write_frame_csv(frame)
+            try:
+                self._write_queue.put_nowait(IMUFrame(
+                    timestamp_ns=timestamp_ns,
+                    frame_number=self.frame_count,
+                    data=imu_data
+                ))
+            except queue.Full:
+                logger.warning(f"Write queue full, dropping frame {self.frame_count}")
         
         self.frame_count += 1
     
-    def _write_frame_csv(self, frame: IMUFrame) -> None:
-        """Write a single frame to CSV file."""
+    def _writer_loop(self) -> None:
+        """Write queued frames to the CSV file until close() sends None."""
+        while True:
+            # Wait for one frame, then take everything else that is already queued
+            frames = [self._write_queue.get()]
+            while True:
+                try:
+                    frames.append(self._write_queue.get_nowait())
+                except queue.Empty:
+                    break
+            done = frames[-1] is None
+            if done:
+                frames.pop()
+            if frames:
+                self._write_frames_csv(frames)
+            if done:
+                return
+    
+    def _write_frames_csv(self, frames) -> None:
+        """Write a batch of frames to the CSV file."""
         try:
-            row = {
-                'timestamp_ns': frame.timestamp_ns,
-                'frame': frame.frame_number,
-                'index': frame.data['index'],
-                'yaw': frame.data['yaw'],
-                'pitch': frame.data['pitch'],
-                'roll': frame.data['roll'],
-                'x_acceleration': frame.data['x_acceleration'],
-                'y_acceleration': frame.data['y_acceleration'],
-                'z_acceleration': frame.data['z_acceleration'],
-                'motion_intent': frame.data['motion_intent'],
-                'motion_request': frame.data['motion_request']
-            }
-            self.csv_writer.writerow(row)
-            self.csv_file.flush()
+            self.csv_file.write(''.join(
+                _CSV_ROW % (frame.timestamp_ns, frame.frame_number, *frame.data) for frame in frames
+            ))
+            # Flush if the batch reached a multiple of flush_every frames
+            if self.flush_every and \
+                    (frames[-1].frame_number + 1) // self.flush_every > frames[0].frame_number // self.flush_every:
+                self.csv_file.flush()
         except Exception as e:
-            logger.error(f"Error writing frame to CSV: {e}")
-    
+            logger.error(f"Error writing frames to CSV: {e}")
+
     def save(self) -> None:
-        """Save the recorded data to file."""
+        """Save the recorded data to file.
+
+        Does nothing if no frames were added since the last successful save.
+        """
         if not self.buffer_in_memory:
             logger.info("Data already saved (not buffering in memory)")
             return
+        if self._saved_frame_count == self.frame_count:
+            return
             
         try:
-            with open(f"{self.base_filename}.csv", 'w', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=[
-                    'timestamp_ns', 'frame', 'index',
-                    'yaw', 'pitch', 'roll',
-                    'x_acceleration', 'y_acceleration', 'z_acceleration',
-                    'motion_intent', 'motion_request'
-                ])
-                writer.writeheader()
-                
-                for frame in self.frames:
-                    try:
-                        row = {
-                            'timestamp_ns': frame.timestamp_ns,
-                            'frame': frame.frame_number,
-                            'index': frame.data['index'],
-                            'yaw': frame.data['yaw'],
-                            'pitch': frame.data['pitch'],
-                            'roll': frame.data['roll'],
-                            'x_acceleration': frame.data['x_acceleration'],
-                            'y_acceleration': frame.data['y_acceleration'],
-                            'z_acceleration': frame.data['z_acceleration'],
-                            'motion_intent': frame.data['motion_intent'],
-                            'motion_request': frame.data['motion_request']
-                        }
-                        writer.writerow(row)
-                    except Exception as e:
-                        logger.error(f"Error writing frame {frame.frame_number} to CSV: {e}")
-                        continue
-                        
-            logger.info(f"Saved {len(self.frames)} frames to {self.base_filename}.csv")
+            frames = self.frames
+            if self.format_type == 'npz':
+                np.savez_compressed(f"{self.base_filename}.npz", **{name: frames[name] for name in _FRAME_DTYPE.names})
+            else:
+                np.savetxt(f"{self.base_filename}.csv", frames, fmt=_CSV_FORMAT, delimiter=',',
+                           header=','.join(_CSV_FIELDS), comments='')
+            self._saved_frame_count = self.frame_count
+            logger.info(f"Saved {len(frames)} frames to {self.base_filename}.{self.format_type}")
         except Exception as e:
-            logger.error(f"Error saving to CSV file: {e}")
+            logger.error(f"Error saving to {self.format_type.upper()} file: {e}")
     
     def close(self) -> None:
         """Close the recorder and save any buffered data."""
@@ -147,6 +206,11 @@ class IMURecorder:
             if self.buffer_in_memory:
                 self.save()
             elif self.csv_file is not None:
+                # Let the writer thread finish the queued frames
+                self._write_queue.put(None)
+                self._writer_thread.join()
+                self.csv_file.flush()
+                os.fsync(self.csv_file.fileno())
                 self.csv_file.close()
                 self.csv_file = None
             logger.info(f"Recorder closed. Recorded {self.frame_count} frames.")
@@ -177,34 +241,37 @@ def main(port: str = '/dev/ttyUSB0'):
         print(f"Recording data to {base_filename}.csv")
         print("Press Ctrl+C to stop recording")
         
-        start_time = time.time()
-        last_status_update = time.time()
+        start_time = time.monotonic()
+        last_status_update = start_time
         
-        while True:
-            # Get next IMU reading
-            imu_data = next(imu)
-            if imu_data is not None:
-                # Add frame to recorder
-                recorder.add_frame(imu_data)
-                
-                # Print status update every second
-                current_time = time.time()
-                if current_time - last_status_update >= 1.0:
-                    elapsed_time = current_time - start_time
-                    frames_per_second = recorder.frame_count / elapsed_time if elapsed_time > 0 else 0
-                    print(f"\rFrame: {recorder.frame_count}, Rate: {frames_per_second:.1f} Hz    ", end="", flush=True)
-                    last_status_update = current_time
+        # Bind the per-sample calls once, the loop runs at the IMU rate
+        add_frame = recorder.add_frame
+        monotonic = time.monotonic
+        
+        # next() blocks until the IMU delivers a sample, which paces the loop
+        for imu_data in imu:
+            # Add frame to recorder
+            add_frame(imu_data)
             
-            time.sleep(0.01)  # 100Hz update rate
+            # Print status update every second; stderr is line buffered, so the
+            # carriage return already flushes it and stdout stays free for output
+            current_time = monotonic()
+            if current_time - last_status_update >= 1.0:
+                # At least one second has passed here, so elapsed_time is never zero
+                elapsed_time = current_time - start_time
+                frames_per_second = recorder.frame_count / elapsed_time
+                sys.stderr.write(f"\rFrame: {recorder.frame_count}, Rate: {frames_per_second:.1f} Hz    ")
+                last_status_update = current_time
             
     except KeyboardInterrupt:
         print("\nRecording stopped by user")
     finally:
-        # Close recorder
+        # Stop the IMU reader and close recorder
+        imu.close()
         recorder.close()
         
         # Print final statistics
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.monotonic() - start_time
         print("\nRecording completed:")
         print(f"Total frames: {recorder.frame_count}")
         print(f"Average frames per second: {recorder.frame_count/elapsed_time:.1f}" if elapsed_time > 0 else "No time elapsed")
@@ -1,12 +1,15 @@
 import argparse
+import functools
 import os
-import logging
-import re
 
-from .record import main as record_main
-from .radar import DEFAULT_BRIDGE_CONTROL_ENDPOINT, DEFAULT_BRIDGE_DATA_ENDPOINT
+# Must match the defaults in .radar, which is not imported here so that --help
+# and the gui command don't load the radar stack just for two strings
+DEFAULT_BRIDGE_CONTROL_ENDPOINT = "tcp://127.0.0.1:5557"
+DEFAULT_BRIDGE_DATA_ENDPOINT = "tcp://127.0.0.1:5556"
 
-RUNNER_CI = True if os.getenv("CI") == "true" else False
+_SERIAL_CHARS = frozenset('0123456789ABCDEF')
+_LOG_LEVEL_CHOICES = ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
+_TRANSPORT_CHOICES = ('auto', 'serial', 'network')
 
 def start_gui(args):
     """Start the Panel GUI server."""
@@ -40,9 +43,23 @@ def start_gui(args):
     )
 
 
+def start_record(args):
+    """Record radar data to file."""
+    # Import the recorder only when needed
+    from .record import main as record_main
+    record_main(
+        args.serial_number,
+        args.profile,
+        args.transport,
+        args.bridge_control,
+        args.bridge_data,
+    )
+
+
+@functools.lru_cache(maxsize=16)
 def validate_serial(value):
     """Validate serial number format (8 hexadecimal characters)."""
-    if not re.match(r'^[0-9A-F]{8}$', value):
+    if len(value) != 8 or not _SERIAL_CHARS.issuperset(value):
         raise argparse.ArgumentTypeError('Serial number must be 8 hexadecimal characters (0-9, A-F)')
     return value
 
@@ -51,14 +68,14 @@ def main():
     parser = argparse.ArgumentParser(description="XWR68XX ISK Radar Tools")
     parser.add_argument('--log-level', 
                        default='INFO',
-                       choices=['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'],
+                       choices=_LOG_LEVEL_CHOICES,
                        help='Set the logging level (default: INFO)')
     parser.add_argument('--serial-number',
                        type=validate_serial,
                        help='Radar serial number in hex format "1234ABCD"')
     parser.add_argument(
         '--transport',
-        choices=['auto', 'serial', 'network'],
+        choices=_TRANSPORT_CHOICES,
         default='auto',
         help='Select connection transport (auto=prefer serial, fallback to network bridge)'
     )
@@ -90,28 +107,22 @@ def main():
     record_parser = subparsers.add_parser('record', help='Record radar data to CSV file')
     record_parser.add_argument('--profile', default=os.path.join('configs', 'user_profile.cfg'),
                            help='Path to the radar profile configuration file')
-    record_parser.set_defaults(
-        func=lambda args: record_main(
-            args.serial_number,
-            args.profile,
-            args.transport,
-            args.bridge_control,
-            args.bridge_data,
-        )
-    )
+    record_parser.set_defaults(func=start_record)
 
     args = parser.parse_args()
 
-    # Set up logging
+    if args.command is None:
+        parser.print_help()
+        return
+
+    # Set up logging (basicConfig accepts the level name directly); logging is
+    # imported here so --help and the no-command path don't load it
+    import logging
     logging.basicConfig(
-        level=getattr(logging, args.log_level),
+        level=args.log_level,
         format='%(asctime)s - %(module)s - %(levelname)s - %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S',
     )
-    
-    if args.command is None:
-        parser.print_help()
-        return
 
     args.func(args)
 
@@ -1,15 +1,88 @@
 import numpy as np
 import logging
+import functools
 import struct
 from typing import Optional, Tuple, List, Iterator, Dict, Any
 import time
 import os
-import math
 from .point_cloud import RadarPointCloud
 import logging
 
 logger = logging.getLogger(__name__)
 
+# TLV header: type and length (uint32 each)
+_TLV_HEADER = struct.Struct('<II')
+
+# MmwDemo_output_message_stats_t: six uint32 timing and CPU load values
+_STATS = struct.Struct('<6I')
+
+# MmwDemo_temperatureStats_t: tempReportValid (int32), time (uint32) and 10 int16 sensor readings
+_TEMPERATURE_STATS = struct.Struct('<iI10h')
+
+# Wire format dtypes, all TLV payloads are little-endian
+_LE_UINT16 = np.dtype('<u2')
+_LE_INT16 = np.dtype('<i2')
+_LE_FLOAT32 = np.dtype('<f4')
+
+# Shared point cloud for frames without points, read-only so it can be reused by every frame
+_NO_POINTS = np.empty((0, 4), dtype=_LE_FLOAT32)
+_NO_POINTS.flags.writeable = False
+
+
+@functools.lru_cache(maxsize=16)
+def _range_doppler_shape(total_bins: int, num_range_bins: int, num_doppler_bins: int) -> Tuple[int, int]:
+    """Heatmap shape for the given bin count, inferred once per configuration.
+    
+    Mismatch warnings are therefore logged once instead of on every frame.
+    """
+    # Verify dimensions match the data
+    if total_bins == num_range_bins * num_doppler_bins:
+        logger.debug(f"Range-Doppler heatmap shape: {num_range_bins}x{num_doppler_bins}")
+        return num_range_bins, num_doppler_bins
+    
+    # Log warning and try to infer dimensions
+    logging.warning(f"Range-Doppler heatmap dimensions mismatch. Expected {num_range_bins}x{num_doppler_bins} bins but got {total_bins} total bins.")
+    
+    # Try to infer dimensions from the data
+    if total_bins % num_range_bins == 0:
+        inferred_doppler_bins = total_bins // num_range_bins
+        logging.info(f"Inferred {inferred_doppler_bins} Doppler bins from data (expected {num_doppler_bins})")
+        return num_range_bins, inferred_doppler_bins
+    
+    # Use square matrix as fallback
+    dim = int(np.sqrt(total_bins))
+    if dim * dim == total_bins:
+        logging.warning(f"Using square heatmap: {dim}x{dim}")
+        return dim, dim
+    
+    # Last resort: use as 1D array
+    logging.warning(f"Using 1D heatmap: 1x{total_bins}")
+    return 1, total_bins
+
+
+@functools.lru_cache(maxsize=16)
+def _range_doppler_axes(num_range_bins: int, range_resolution: float, num_doppler_bins: int,
+                        chirp_duration: float, chirps_per_frame: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Range (m) and velocity (m/s) axes of the range-Doppler heatmap.
+    
+    The arrays are shared between frames with the same configuration and are read-only.
+    """
+    wavelength = 3e8 / (77e9)  # Speed of light / radar frequency (assuming 77 GHz)
+    velocity_resolution = wavelength / (4 * chirp_duration * chirps_per_frame)  # m/s per bin
+    
+    range_axis = np.arange(num_range_bins) * range_resolution
+    velocity_axis = np.linspace(-num_doppler_bins//2, num_doppler_bins//2-1, num_doppler_bins) * velocity_resolution
+    range_axis.flags.writeable = False
+    velocity_axis.flags.writeable = False
+    return range_axis, velocity_axis
+
+
+def _iq_magnitude(iq: np.ndarray) -> np.ndarray:
+    """Magnitude of int16 [imag, real] pairs along the last axis, without a complex temporary."""
+    # The converted imaginary part doubles as the output buffer
+    magnitude = iq[..., 0].astype(np.float32)
+    return np.hypot(magnitude, iq[..., 1], out=magnitude)
+
 class RadarData:
     """
     Parser for radar data packets.
@@ -21,12 +94,12 @@ class RadarData:
         MMWDEMO_OUTPUT_MSG_DETECTED_POINTS (int): TLV type for point cloud data
         MMWDEMO_OUTPUT_MSG_RANGE_PROFILE (int): TLV type for range profile data
         MMWDEMO_OUTPUT_MSG_DETECTED_POINTS_SIDE_INFO (int): TLV type for side info
-        pc (Tuple[List[float], List[float], List[float], List[float]]): Point cloud data (x,y,z,velocity)
+        pc (Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]): Point cloud data (x,y,z,velocity)
         adc (np.ndarray): Range profile data (log magnitude)
         adc_complex (np.ndarray): Complex range profile data (raw complex values)
         side_info (Tuple[List[float], List[float]]): SNR and noise data
-        snr (List[float]): Signal-to-noise ratio for each point
-        noise (List[float]): Noise level for each point
+        snr (np.ndarray): Signal-to-noise ratio for each point
+        noise (np.ndarray): Noise level for each point
         range_doppler_heatmap (np.ndarray): Range-Doppler heat map matrix (range bins × Doppler bins)
         noise_profile (np.ndarray): Noise profile data
     """
@@ -43,6 +116,14 @@ class RadarData:
     MMWDEMO_OUTPUT_MSG_TEMPERATURE_STATS = 9
     MMWDEMO_OUTPUT_MSG_RANGE_PROFILE_COMPLEX = 10
     
+    # One instance is created per frame, slots avoid a per-instance __dict__
+    __slots__ = ('radar_connection', 'config_params',
+                 'magic_word', 'version', 'total_packet_len', 'platform', 'frame_number',
+                 'time_cpu_cycles', 'num_detected_obj', 'num_tlvs', 'subframe_number',
+                 '_pc_xyzv', 'adc', 'adc_complex', 'side_info', 'snr', 'noise',
+                 'range_doppler_heatmap', 'azimuth_heatmap', 'noise_profile',
+                 'stats_data', 'temperature_stats_data')
+    
     # Class-level buffer for averaging complex range profile data (linear magnitude)
     _complex_magnitude_buffer = []
     _max_buffer_size = 10
@@ -66,9 +147,10 @@ class RadarData:
         self.time_cpu_cycles = None
         self.num_detected_obj = None
         self.num_tlvs = None
+        self.subframe_number = None
         
         # Data arrays
-        self.pc = ([], [], [], [])  # Point cloud (x, y, z, velocity)
+        self._pc_xyzv = _NO_POINTS  # Point cloud, one (x, y, z, velocity) row per point
         self.adc = None  # Range profile data (log magnitude)
         self.adc_complex = None  # Complex range profile data
         self.side_info = ([], [])  # SNR and noise data
@@ -115,9 +197,16 @@ class RadarData:
                 self.azimuth_heatmap = np.array([])
             return
 
+    @property
+    def pc(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Point cloud as (x, y, z, velocity) column views of the parsed points."""
+        pts = self._pc_xyzv
+        return pts[:, 0], pts[:, 1], pts[:, 2], pts[:, 3]
+
     def _parse_tlv_data(self, data: np.ndarray) -> None:
         """Parse TLV (Type-Length-Value) data from the radar packet."""
-        data_bytes = data
+        # View the payload as bytes once, the parsers take zero-copy dtype views of their TLV
+        data_bytes = np.frombuffer(data, dtype=np.uint8)
         idx = 0  # Start after header
        
        
@@ -126,9 +215,8 @@ class RadarData:
                 logging.warning(f"Insufficient data for TLV header at position {idx}, available: {len(data_bytes) - idx} bytes")
                 break
                 
-            tlv_type = int.from_bytes(data_bytes[idx:idx+4], byteorder='little')
-            tlv_length = int.from_bytes(data_bytes[idx+4:idx+8], byteorder='little')
-            idx += 8
+            tlv_type, tlv_length = _TLV_HEADER.unpack_from(data_bytes, idx)
+            idx += _TLV_HEADER.size
             
             logger.debug(f"TLV {tlv_idx + 1}/{self.num_tlvs}: type={tlv_type}, length={tlv_length}")
             
@@ -142,38 +230,16 @@ class RadarData:
                     idx = self._parse_tlv_with_available_data(data_bytes, idx, tlv_type, available_length)
                 break
                 
-            if tlv_type == self.MMWDEMO_OUTPUT_MSG_DETECTED_POINTS:
-                logger.debug(f"Parsing point cloud data with length {tlv_length}")
-                idx = self._parse_point_cloud(data_bytes, idx, tlv_length)
-            elif tlv_type == self.MMWDEMO_OUTPUT_MSG_RANGE_PROFILE:
-                logger.debug(f"Parsing range profile data with length {tlv_length}")
-                idx = self._parse_range_profile(data_bytes, idx, tlv_length)
-            elif tlv_type == self.MMWDEMO_OUTPUT_MSG_DETECTED_POINTS_SIDE_INFO:
-                logger.debug(f"Parsing side info data with length {tlv_length}")
-                idx = self._parse_side_info(data_bytes, idx, tlv_length)
-            elif tlv_type == self.MMWDEMO_OUTPUT_MSG_RANGE_DOPPLER_HEAT_MAP:
-                logger.debug(f"Parsing range-Doppler heatmap data with length {tlv_length}")
-                idx = self._parse_range_doppler_heatmap(data_bytes, idx, tlv_length)
-            elif tlv_type == self.MMWDEMO_OUTPUT_MSG_AZIMUT_STATIC_HEAT_MAP:
-                logger.debug(f"Parsing azimuth heatmap data with length {tlv_length}")
-                idx = self._parse_azimuth_heatmap(data_bytes, idx, tlv_length)
-            elif tlv_type == self.MMWDEMO_OUTPUT_MSG_NOISE_PROFILE:
-                logger.debug(f"Parsing noise profile data with length {tlv_length}")
-                idx = self._parse_noise_profile(data_bytes, idx, tlv_length)
-            elif tlv_type == self.MMWDEMO_OUTPUT_MSG_STATS:
-                logger.debug(f"Parsing stats data with length {tlv_length}")
-                idx = self._parse_stats(data_bytes, idx, tlv_length)
-            elif tlv_type == self.MMWDEMO_OUTPUT_MSG_TEMPERATURE_STATS:
-                logger.debug(f"Parsing temperature stats data with length {tlv_length}")
-                idx = self._parse_temperature_stats(data_bytes, idx, tlv_length)
-            elif tlv_type == self.MMWDEMO_OUTPUT_MSG_RANGE_PROFILE_COMPLEX:
-                logger.debug(f"Parsing complex range profile data with length {tlv_length}")
-                idx = self._parse_complex_range_profile(data_bytes, idx, tlv_length)
+            parser = self._TLV_PARSERS.get(tlv_type)
+            if parser is not None:
+                parse, description = parser
+                logger.debug(f"Parsing {description} data with length {tlv_length}")
+                idx = parse(self, data_bytes, idx, tlv_length)
             else:
                 logger.debug(f"Skipping unknown TLV type {tlv_type} with length {tlv_length}")
                 idx += tlv_length
 
-    def _parse_tlv_with_available_data(self, data: bytes, idx: int, tlv_type: int, available_length: int) -> int:
+    def _parse_tlv_with_available_data(self, data: np.ndarray, idx: int, tlv_type: int, available_length: int) -> int:
         """Parse TLV data with limited available data.
         
         This method is called when there's insufficient data for a complete TLV.
@@ -194,91 +260,63 @@ class RadarData:
         # In the future, we could implement partial parsing for specific TLV types
         return idx + available_length
 
-    def _parse_point_cloud(self, data: bytes, idx: int, tlv_length: int) -> int:
+    def _parse_point_cloud(self, data: np.ndarray, idx: int, tlv_length: int) -> int:
         """Parse point cloud data from TLV."""
         # Ensure tlv_length is a multiple of 16 (each point is 16 bytes)
         usable_length = tlv_length - (tlv_length % 16)
         num_points = usable_length // 16
         
-        x, y, z, v = [], [], [], []
-        
         if usable_length <= 0:
             logging.warning("Point cloud data length is not a multiple of point size (16 bytes)")
-            self.pc = (x, y, z, v)
+            self._pc_xyzv = _NO_POINTS
             return idx + tlv_length
         
-        try:
-            for point in range(num_points):
-                point_idx = idx + (point * 16)
-                if point_idx + 16 > len(data):  # Check if we have enough data
-                    logging.warning(f"Insufficient data for point cloud at point {point}")
-                    break
-                
-                try:
-                    x.append(struct.unpack('f', data[point_idx:point_idx+4])[0])
-                    y.append(struct.unpack('f', data[point_idx+4:point_idx+8])[0])
-                    z.append(struct.unpack('f', data[point_idx+8:point_idx+12])[0])
-                    v.append(struct.unpack('f', data[point_idx+12:point_idx+16])[0])
-                except struct.error as e:
-                    logging.warning(f"Error unpacking point cloud data at point {point}: {e}")
-                    continue
-        except Exception as e:
-            logging.error(f"Error processing point cloud data: {e}")
+        if idx + usable_length > len(data):  # Check if we have enough data
+            num_points = max(len(data) - idx, 0) // 16
+            logging.warning(f"Insufficient data for point cloud at point {num_points}")
         
-        self.pc = (x, y, z, v)
+        # Each point is x, y, z, v as little-endian float32, view them without copying
+        self._pc_xyzv = data[idx:idx + num_points * 16].view(_LE_FLOAT32).reshape(-1, 4)
         return idx + tlv_length
 
-    def _parse_range_profile(self, data: bytes, idx: int, tlv_length: int) -> int:
+    def _parse_range_profile(self, data: np.ndarray, idx: int, tlv_length: int) -> int:
         """Parse range profile data from TLV."""
         # Ensure tlv_length is a multiple of 2 (size of uint16)
         usable_length = tlv_length - (tlv_length % 2)
         logger.debug(f"usable_length: {usable_length}")
         if usable_length > 0:
             logger.debug("Starting to parse range profile data")
-            self.adc = np.frombuffer(data[idx:idx+usable_length], dtype=np.uint16)
+            self.adc = data[idx:idx+usable_length].view(_LE_UINT16)
         else:
             logging.warning("Range profile data length is not a multiple of uint16 size")
             self.adc = np.array([], dtype=np.uint16)
         return idx + tlv_length
 
-    def _parse_side_info(self, data: bytes, idx: int, tlv_length: int) -> int:
+    def _parse_side_info(self, data: np.ndarray, idx: int, tlv_length: int) -> int:
         """Parse side information (SNR and noise) from TLV."""
-        num_points = tlv_length // 4
         self.snr = []
         self.noise = []
         
-        try:
-            # Ensure tlv_length is a multiple of 4 (each point is 4 bytes)
-            usable_length = tlv_length - (tlv_length % 4)
-            usable_points = usable_length // 4
-            
-            if usable_points == 0:
-                logging.warning("Side info data length is not a multiple of point size (4 bytes)")
-                return idx + tlv_length
-                
-            for point in range(usable_points):
-                point_idx = idx + (point * 4)
-                if point_idx + 4 > len(data):  # Check if we have enough data
-                    logging.warning(f"Insufficient data for side info at point {point}: needed 4 bytes, had {len(data) - point_idx}")
-                    break
-                    
-                try:
-                    snr_val = struct.unpack('h', data[point_idx:point_idx+2])[0] * 0.1
-                    noise_val = struct.unpack('h', data[point_idx+2:point_idx+4])[0] * 0.1
-                    self.snr.append(snr_val)
-                    self.noise.append(noise_val)
-                except struct.error as e:
-                    logging.warning(f"Error unpacking side info at point {point}: {e}")
-                    continue
-                
-        except Exception as e:
-            logging.warning(f"Error processing side info data: {e}")
-            self.snr = []
-            self.noise = []
+        # Ensure tlv_length is a multiple of 4 (each point is 4 bytes)
+        usable_points = tlv_length // 4
+        
+        if usable_points == 0:
+            logging.warning("Side info data length is not a multiple of point size (4 bytes)")
+            return idx + tlv_length
+        
+        if idx + usable_points * 4 > len(data):  # Check if we have enough data
+            logging.warning(f"Insufficient data for side info: needed {usable_points * 4} bytes, had {len(data) - idx}")
+            usable_points = max(len(data) - idx, 0) // 4
+        
+        # Each point is an int16 SNR and noise pair in 0.1 dB steps
+        side_info = data[idx:idx + usable_points * 4].view(_LE_INT16).reshape(-1, 2)
+        side_info = side_info.astype(np.float32) * 0.1
+        self.snr = side_info[:, 0]
+        self.noise = side_info[:, 1]
         
         return idx + tlv_length
 
-    def _parse_range_doppler_heatmap(self, data: bytes, idx: int, tlv_length: int) -> int:
+    def _parse_range_doppler_heatmap(self, data: np.ndarray, idx: int, tlv_length: int) -> int:
         """Parse range-Doppler heat map data from TLV.
         
         The heat map is a log magnitude range-Doppler matrix stored as uint16_t values.
@@ -304,8 +342,8 @@ class RadarData:
             return idx + tlv_length
         
         try:
-            # Create numpy array from raw bytes
-            heatmap = np.frombuffer(data[idx:idx+usable_length], dtype=np.uint16)
+            # View raw bytes as uint16
+            heatmap = data[idx:idx+usable_length].view(_LE_UINT16)
             
             # Get dimensions from radar configuration
             num_range_bins = self.config_params.get('rangeBins', 256)  # Default from config files
@@ -313,38 +351,16 @@ class RadarData:
             
             logger.debug(f"num_range_bins: {num_range_bins}, num_doppler_bins: {num_doppler_bins}")
 
-            # Verify dimensions match the data
-            if total_bins == num_range_bins * num_doppler_bins:
-                # Reshape using actual dimensions
-                self.range_doppler_heatmap = heatmap.reshape(num_range_bins, num_doppler_bins)
-                logger.debug(f"Successfully parsed range-Doppler heatmap: {num_range_bins}x{num_doppler_bins}")
-            else:
-                # Log warning and try to infer dimensions
-                logging.warning(f"Range-Doppler heatmap dimensions mismatch. Expected {num_range_bins}x{num_doppler_bins} bins but got {total_bins} total bins.")
-                
-                # Try to infer dimensions from the data
-                if total_bins % num_range_bins == 0:
-                    inferred_doppler_bins = total_bins // num_range_bins
-                    logging.info(f"Inferred {inferred_doppler_bins} Doppler bins from data (expected {num_doppler_bins})")
-                    self.range_doppler_heatmap = heatmap.reshape(num_range_bins, inferred_doppler_bins)
-                else:
-                    # Use square matrix as fallback
-                    dim = int(np.sqrt(total_bins))
-                    if dim * dim == total_bins:
-                        self.range_doppler_heatmap = heatmap.reshape(dim, dim)
-                        logging.warning(f"Using square heatmap: {dim}x{dim}")
-                    else:
-                        # Last resort: use as 1D array
-                        self.range_doppler_heatmap = heatmap.reshape(1, -1)
-                        logging.warning(f"Using 1D heatmap: 1x{total_bins}")
-                        
+            self.range_doppler_heatmap = heatmap.reshape(
+                _range_doppler_shape(total_bins, num_range_bins, num_doppler_bins))
+            
         except Exception as e:
             logging.error(f"Error processing range-Doppler heatmap: {e}")
             self.range_doppler_heatmap = np.array([], dtype=np.uint16)
         
         return idx + tlv_length
 
-    def _parse_azimuth_heatmap(self, data: bytes, idx: int, tlv_length: int) -> int:
+    def _parse_azimuth_heatmap(self, data: np.ndarray, idx: int, tlv_length: int) -> int:
         """Parse azimuth static heat map data from TLV.
         
         According to TI documentation, the data format is:
@@ -375,8 +391,8 @@ class RadarData:
             return idx + tlv_length
         
         try:
-            # Create numpy array from raw bytes as int16 (2 bytes per value)
-            complex_data = np.frombuffer(data[idx:idx+tlv_length], dtype=np.int16)
+            # View raw bytes as int16 (2 bytes per value)
+            complex_data = data[idx:idx+tlv_length].view(_LE_INT16)
             
             # Get dimensions from radar configuration
             num_range_bins = self.config_params.get('rangeBins', 256)
@@ -388,11 +404,8 @@ class RadarData:
                 # Reshape to (range_bins, num_virtual_antennas, 2) where 2 represents [imag, real]
                 heatmap_complex = complex_data.reshape(num_range_bins, num_virtual_antennas, 2)
                 
-                # Convert to complex numbers: imag + j*real
-                heatmap = heatmap_complex[:, :, 0].astype(np.float32) + 1j * heatmap_complex[:, :, 1].astype(np.float32)
-                
                 # Take magnitude for visualization
-                self.azimuth_heatmap = np.abs(heatmap)
+                self.azimuth_heatmap = _iq_magnitude(heatmap_complex)
                 logger.debug(f"Successfully parsed azimuth heatmap: {num_range_bins}x{num_virtual_antennas}")
             else:
                 # Try to infer dimensions from the data
@@ -402,8 +415,7 @@ class RadarData:
                     
                     # Reshape with inferred dimensions
                     heatmap_complex = complex_data.reshape(num_range_bins, inferred_antennas, 2)
-                    heatmap = heatmap_complex[:, :, 0].astype(np.float32) + 1j * heatmap_complex[:, :, 1].astype(np.float32)
-                    self.azimuth_heatmap = np.abs(heatmap)
+                    self.azimuth_heatmap = _iq_magnitude(heatmap_complex)
                     logger.debug(f"Successfully parsed azimuth heatmap with inferred dimensions: {num_range_bins}x{inferred_antennas}")
                 else:
                     logging.warning(f"Azimuth heatmap dimensions mismatch. Expected {num_range_bins}x{num_virtual_antennas} complex values but got {total_complex_values} total values.")
@@ -414,8 +426,7 @@ class RadarData:
                         if side_length * side_length == total_complex_values:
                             # Perfect square
                             heatmap_complex = complex_data.reshape(side_length, side_length, 2)
-                            heatmap = heatmap_complex[:, :, 0].astype(np.float32) + 1j * heatmap_complex[:, :, 1].astype(np.float32)
-                            self.azimuth_heatmap = np.abs(heatmap)
+                            self.azimuth_heatmap = _iq_magnitude(heatmap_complex)
                             logger.warning(f"Created square azimuth heatmap: {side_length}x{side_length}")
                         else:
                             # Not a perfect square, use as 1D array
@@ -429,20 +440,20 @@ class RadarData:
         
         return idx + tlv_length
 
-    def _parse_noise_profile(self, data: bytes, idx: int, tlv_length: int) -> int:
+    def _parse_noise_profile(self, data: np.ndarray, idx: int, tlv_length: int) -> int:
         """Parse noise profile data from TLV."""
         # Ensure tlv_length is a multiple of 2 (size of uint16)
         usable_length = tlv_length - (tlv_length % 2)
         logger.debug(f"usable_length: {usable_length}")
         if usable_length > 0:
             logger.debug("Starting to parse noise profile data")
-            self.noise_profile = np.frombuffer(data[idx:idx+usable_length], dtype=np.uint16)
+            self.noise_profile = data[idx:idx+usable_length].view(_LE_UINT16)
         else:
             logging.warning("Noise profile data length is not a multiple of uint16 size")
             self.noise_profile = np.array([], dtype=np.uint16)
         return idx + tlv_length
 
-    def _parse_stats(self, data: bytes, idx: int, tlv_length: int) -> int:
+    def _parse_stats(self, data: np.ndarray, idx: int, tlv_length: int) -> int:
         """Parse stats data from TLV.
         
         Based on MmwDemo_output_message_stats_t structure:
@@ -459,14 +470,11 @@ class RadarData:
         raw_data = data[idx:idx+tlv_length]
         self.stats_data = raw_data
         
-        if tlv_length == 24:  # 6 uint32_t values
+        if tlv_length == _STATS.size:  # 6 uint32_t values
             # Parse according to MmwDemo_output_message_stats_t structure
-            inter_frame_processing_time = int.from_bytes(raw_data[0:4], byteorder='little')
-            transmit_output_time = int.from_bytes(raw_data[4:8], byteorder='little')
-            inter_frame_processing_margin = int.from_bytes(raw_data[8:12], byteorder='little')
-            inter_chirp_processing_margin = int.from_bytes(raw_data[12:16], byteorder='little')
-            active_frame_cpu_load = int.from_bytes(raw_data[16:20], byteorder='little')
-            inter_frame_cpu_load = int.from_bytes(raw_data[20:24], byteorder='little')
+            (inter_frame_processing_time, transmit_output_time,
+             inter_frame_processing_margin, inter_chirp_processing_margin,
+             active_frame_cpu_load, inter_frame_cpu_load) = _STATS.unpack_from(data, idx)
             
             logger.info(f"Stats data:")
             logger.info(f"  Inter-frame processing time: {inter_frame_processing_time} usec")
@@ -477,12 +485,12 @@ class RadarData:
             logger.info(f"  Inter-frame CPU load: {inter_frame_cpu_load}%")
         else:
             # Unknown structure, log as hex
-            hex_data = raw_data.hex()
+            hex_data = raw_data.tobytes().hex()
             logger.info(f"Stats data (unknown structure, {tlv_length} bytes): {hex_data}")
         
         return idx + tlv_length
 
-    def _parse_temperature_stats(self, data: bytes, idx: int, tlv_length: int) -> int:
+    def _parse_temperature_stats(self, data: np.ndarray, idx: int, tlv_length: int) -> int:
         """Parse temperature stats data from TLV.
         
         Based on MmwDemo_temperatureStats_t structure:
@@ -508,51 +516,22 @@ class RadarData:
         raw_data = data[idx:idx+tlv_length]
         self.temperature_stats_data = raw_data
         
-        # Parse tempReportValid (first 4 bytes)
         if tlv_length >= 4:
-            temp_report_valid = int.from_bytes(raw_data[0:4], byteorder='little', signed=True)
-            logger.info(f"Temperature stats data:")
-            logger.info(f"  Temperature report valid: {temp_report_valid}")
-            
-            # Parse the remaining data (24 bytes) as rlRfTempData_t structure
-            if tlv_length == 28:  # Expected size: 4 bytes int32 + 24 bytes rlRfTempData_t
-                remaining_data = raw_data[4:]
-                
-                if len(remaining_data) == 24:
-                    # Parse according to rlRfTempData_t structure
-                    time_ms = int.from_bytes(remaining_data[0:4], byteorder='little')
-                    
-                    # Parse 10 temperature sensors (each 2 bytes, signed int16)
-                    temp_sensors = []
-                    for i in range(4, 24, 2):
-                        temp_val = int.from_bytes(remaining_data[i:i+2], byteorder='little', signed=True)
-                        temp_sensors.append(temp_val)
-                    
-                    logger.info(f"  Time from powerup: {time_ms} ms")
-                    logger.info(f"  Temperature sensors (deg C):")
-                    logger.info(f"    RX0: {temp_sensors[0]}°C")
-                    logger.info(f"    RX1: {temp_sensors[1]}°C")
-                    logger.info(f"    RX2: {temp_sensors[2]}°C")
-                    logger.info(f"    RX3: {temp_sensors[3]}°C")
-                    logger.info(f"    TX0: {temp_sensors[4]}°C")
-                    logger.info(f"    TX1: {temp_sensors[5]}°C")
-                    logger.info(f"    TX2: {temp_sensors[6]}°C")
-                    logger.info(f"    PM:  {temp_sensors[7]}°C")
-                    logger.info(f"    Dig0: {temp_sensors[8]}°C")
-                    logger.info(f"    Dig1: {temp_sensors[9]}°C")
-                    
-                    # Also show the raw uint16 interpretation for comparison
-                    uint16_values = []
-                    for i in range(4, 24, 2):
-                        val = int.from_bytes(remaining_data[i:i+2], byteorder='little')
-                        uint16_values.append(val)
-                    logger.info(f"  Raw uint16 values: {uint16_values}")
-                        
-                else:
-                    logger.warning(f"Unexpected temperature data length: {len(remaining_data)} bytes")
-                    hex_data = ' '.join(f'{b:02x}' for b in remaining_data)
-                    logger.info(f"Temperature stats data (unknown structure, {len(remaining_data)} bytes): {hex_data}")
+            # tempReportValid followed by the 24-byte rlRfTempData_t structure
+            if tlv_length == _TEMPERATURE_STATS.size:  # Expected size: 4 bytes int32 + 24 bytes rlRfTempData_t
+                # The decoded values are only logged, skip the work when INFO is disabled
+                if logger.isEnabledFor(logging.INFO):
+                    # 10 temperature sensors as signed int16, the raw uint16 interpretation is shown for comparison
+                    temp_report_valid, time_ms, *temp_sensors = _TEMPERATURE_STATS.unpack_from(data, idx)
+                    logger.info(f"Temperature stats data: report valid {temp_report_valid}, "
+                                f"time from powerup {time_ms} ms, "
+                                f"RX0-3 {temp_sensors[0:4]}°C, TX0-2 {temp_sensors[4:7]}°C, "
+                                f"PM {temp_sensors[7]}°C, Dig0-1 {temp_sensors[8:10]}°C, "
+                                f"raw uint16 values {[val & 0xFFFF for val in temp_sensors]}")
             else:
+                # Parse tempReportValid (first 4 bytes)
+                temp_report_valid = int.from_bytes(raw_data[0:4], byteorder='little', signed=True)
+                logger.info(f"Temperature stats data: report valid {temp_report_valid}")
                 logger.warning(f"Unexpected TLV length for temperature stats: {tlv_length} bytes")
                 hex_data = ' '.join(f'{b:02x}' for b in raw_data)
                 logger.info(f"Temperature stats data (unknown structure, {tlv_length} bytes): {hex_data}")
@@ -563,7 +542,7 @@ class RadarData:
         
         return idx + tlv_length
 
-    def _parse_complex_range_profile(self, data: bytes, idx: int, tlv_length: int) -> int:
+    def _parse_complex_range_profile(self, data: np.ndarray, idx: int, tlv_length: int) -> int:
         """Parse complex range profile data from TLV.
         
         The complex data format follows the cmplx16ImRe_t structure:
@@ -588,8 +567,8 @@ class RadarData:
             return idx + tlv_length
         
         try:
-            # Create numpy array from raw bytes as int16 (2 bytes per value)
-            complex_data = np.frombuffer(data[idx:idx+tlv_length], dtype=np.int16)
+            # View raw bytes as int16 (2 bytes per value)
+            complex_data = data[idx:idx+tlv_length].view(_LE_INT16)
             
             # Get number of range bins from configuration
             num_range_bins = self.config_params.get('rangeBins', 256)
@@ -622,6 +601,19 @@ class RadarData:
         
         return idx + tlv_length
 
+    # TLV type -> (parser, description), looked up once per TLV in _parse_tlv_data
+    _TLV_PARSERS = {
+        MMWDEMO_OUTPUT_MSG_DETECTED_POINTS: (_parse_point_cloud, "point cloud"),
+        MMWDEMO_OUTPUT_MSG_RANGE_PROFILE: (_parse_range_profile, "range profile"),
+        MMWDEMO_OUTPUT_MSG_DETECTED_POINTS_SIDE_INFO: (_parse_side_info, "side info"),
+        MMWDEMO_OUTPUT_MSG_RANGE_DOPPLER_HEAT_MAP: (_parse_range_doppler_heatmap, "range-Doppler heatmap"),
+        MMWDEMO_OUTPUT_MSG_AZIMUT_STATIC_HEAT_MAP: (_parse_azimuth_heatmap, "azimuth heatmap"),
+        MMWDEMO_OUTPUT_MSG_NOISE_PROFILE: (_parse_noise_profile, "noise profile"),
+        MMWDEMO_OUTPUT_MSG_STATS: (_parse_stats, "stats"),
+        MMWDEMO_OUTPUT_MSG_TEMPERATURE_STATS: (_parse_temperature_stats, "temperature stats"),
+        MMWDEMO_OUTPUT_MSG_RANGE_PROFILE_COMPLEX: (_parse_complex_range_profile, "complex range profile"),
+    }
+
     def to_point_cloud(self) -> RadarPointCloud:
         """
         Convert the radar data to a RadarPointCloud object.
@@ -629,31 +621,15 @@ class RadarData:
         Returns:
             RadarPointCloud: Point cloud representation of the radar data
         """
-        if self.pc is None:
-            return RadarPointCloud()
-            
+        # Column views of the parsed points, nothing is copied here
         x, y, z, v = self.pc
         
         # Convert Cartesian coordinates to spherical coordinates
-        range_values = []
-        azimuth = []
-        elevation = []
-        
-        for i in range(len(x)):
-            # Calculate range
-            r = math.sqrt(x[i]**2 + y[i]**2 + z[i]**2)
-            range_values.append(r)
-            
-            # Calculate azimuth (horizontal angle)
-            az = math.atan2(x[i], y[i])
-            azimuth.append(az)
-            
-            # Calculate elevation (vertical angle)
-            if r > 0:
-                el = math.asin(z[i] / r)
-            else:
-                el = 0
-            elevation.append(el)
+        range_array = np.sqrt(x * x + y * y + z * z)
+        azimuth_array = np.arctan2(x, y)  # Horizontal angle
+        # Vertical angle, zero for points at the origin
+        sin_el = np.divide(z, range_array, out=np.zeros_like(range_array), where=range_array > 0)
+        elevation_array = np.arcsin(np.clip(sin_el, -1.0, 1.0))
         
         # Create metadata dictionary
         metadata = {
@@ -662,30 +638,23 @@ class RadarData:
             'timestamp': self.time_cpu_cycles
         }
         
-        # Convert lists to numpy arrays
-        range_array = np.array(range_values)
-        velocity_array = np.array(v)
-        azimuth_array = np.array(azimuth)
-        elevation_array = np.array(elevation)
-        snr_array = np.array(self.snr) if self.snr else np.zeros(len(range_values))
+        snr_array = np.asarray(self.snr) if len(self.snr) else np.zeros(len(range_array))
         
         # Calculate RCS values based on SNR and range
         # This is a simplified model; actual RCS calculation would depend on radar parameters
-        if snr_array is not None and len(snr_array) > 0:
-            # Convert SNR from dB to linear scale with clipping to prevent overflow
-            snr_db = np.clip(snr_array, -100, 100)  # Limit SNR range to prevent overflow
-            snr_linear = np.power(10.0, snr_db/10.0)
-            # RCS is proportional to SNR * range^4 (radar equation)
+        if len(snr_array) > 0:
+            snr_db = np.clip(snr_array, -100, 100)  # Limit SNR range
+            # RCS is proportional to SNR * range^4 / 1e6 (radar equation), computed in dB:
+            # 10*log10(10^(snr/10) * r^4 / 1e6) = snr + 40*log10(r) - 60, floored at -100 dB
             # This is a simplified calculation for demonstration
-            rcs_array = snr_linear * np.power(range_array, 4) / 1e6  # Scaling factor
-            # Convert back to dB scale
-            rcs_array = 10 * np.log10(np.maximum(rcs_array, 1e-10))
+            rcs_array = snr_db + 40.0 * np.log10(np.maximum(range_array, 1e-10)) - 60.0
+            rcs_array = np.maximum(rcs_array, -100.0)
         else:
-            rcs_array = np.zeros(len(range_values))
+            rcs_array = np.zeros(len(range_array))
         
         return RadarPointCloud(
             range=range_array,
-            velocity=velocity_array,
+            velocity=v,
             azimuth=azimuth_array,
             elevation=elevation_array,
             snr=snr_array,
@@ -742,24 +711,26 @@ class RadarData:
         # Calculate velocity resolution from chirp parameters
         chirp_duration = self.config_params.get('rampEndTime', 60) * 1e-6  # Convert μs to seconds
         chirps_per_frame = self.config_params.get('chirpsPerFrame', 32)
-        wavelength = 3e8 / (77e9)  # Speed of light / radar frequency (assuming 77 GHz)
-        velocity_resolution = wavelength / (4 * chirp_duration * chirps_per_frame)  # m/s per bin
         
-        # Create range and velocity axes
-        range_axis = np.arange(num_range_bins) * range_resolution
+        # Range and velocity axes only change with the configuration
         num_doppler_bins = self.range_doppler_heatmap.shape[1]
-        velocity_axis = np.linspace(-num_doppler_bins//2, num_doppler_bins//2-1, num_doppler_bins) * velocity_resolution
+        range_axis, velocity_axis = _range_doppler_axes(
+            num_range_bins, range_resolution, num_doppler_bins, chirp_duration, chirps_per_frame)
         
         logger.debug(f"Range-Doppler heatmap: range_axis from 0 to {range_axis[-1]:.3f} m, velocity_axis from {velocity_axis[0]:.3f} to {velocity_axis[-1]:.3f} m/s")
         
-        # Check for invalid data
-        if np.any(np.isnan(self.range_doppler_heatmap)) or np.any(np.isinf(self.range_doppler_heatmap)):
+        # Check for invalid data (the parsed uint16 heatmap cannot hold NaN or Inf)
+        if np.issubdtype(self.range_doppler_heatmap.dtype, np.floating) and not np.all(np.isfinite(self.range_doppler_heatmap)):
             logger.warning("Range-Doppler heatmap contains NaN or Inf values")
             return np.array([]), np.array([]), np.array([])
         
         # Convert heatmap values to dB (assuming they are linear magnitude)
         try:
-            heatmap_db = 20 * np.log10(self.range_doppler_heatmap.astype(np.float32) + 1)  # Add 1 to avoid log(0)
+            # One float32 copy, the remaining steps run in place
+            heatmap_db = self.range_doppler_heatmap.astype(np.float32)
+            heatmap_db += 1  # Add 1 to avoid log(0)
+            np.log10(heatmap_db, out=heatmap_db)
+            heatmap_db *= 20
             return heatmap_db, range_axis, velocity_axis
         except Exception as e:
             logger.error(f"Error converting range-Doppler heatmap to dB: {e}")
@@ -111,7 +111,13 @@ class AntennaConfigEnum(str, Enum):
     CFG_2RX_1TX_60DEG = "2Rx,1Tx(60 deg)"
     # Add other antenna configurations as needed
 
+# Radial velocity resolutions selectable in the GUI (m/s); the first is the fallback
+RADIAL_VELOCITY_RESOLUTION_OPTIONS = (0.07, 0.13)
+
 class RadarConfig(BaseModel):
+    # Build the validator on first use rather than at import time
+    model_config = ConfigDict(defer_build=True)
+
     antenna_config: AntennaConfigEnum = Field(
         AntennaConfigEnum.CFG_4RX_3TX_15DEG_ELEV,
         description="Selected antenna configuration preset for GUI/scene selection. Not sent to radar as a command."
@@ -192,6 +198,12 @@ class RadarConfig(BaseModel):
     bpm_cfg: Optional[dict] = Field(default=None, description="BPM configuration (advanced/expert mode, not sent to radar by default)")
     calib_data: Optional[dict] = Field(default=None, description="Calibration data configuration (advanced/expert mode, not sent to radar by default)")
 
+    @field_validator('radial_velocity_resolution_ms', mode='before')
+    @classmethod
+    def coerce_radial_velocity_resolution(cls, v):
+        """Fall back to the first selectable resolution for values the GUI cannot show."""
+        return v if v in RADIAL_VELOCITY_RESOLUTION_OPTIONS else RADIAL_VELOCITY_RESOLUTION_OPTIONS[0]
+
 # --- New Models for Scene Configuration GUI ---
 
 # Remove SceneProfileConfig, AntennaConfigEnum, DesirableConfigEnum, and their usages